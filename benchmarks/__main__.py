@@ -0,0 +1,119 @@
+"""
+Usage:
+    python -m benchmarks                      # run and compare with the baselines
+    python -m benchmarks --update-baselines   # run and store the results as the baselines
+    python -m benchmarks --scale 10 --scale 1000 --check  # exit with 1 on regressions
+    python -m benchmarks --baselines base/benchmarks/baselines.json  # compare with the results of another checkout
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from typing import Dict, List
+
+BASELINES_PATH = os.path.join(os.path.dirname(__file__), "baselines.json")
+DEFAULT_SCALES = (10, 1000, 10000)
+
+IMPORT_TIME_CODE = """
+from time import perf_counter
+started_at = perf_counter()
+{statement}
+print(perf_counter() - started_at)
+"""
+IMPORT_STATEMENTS = {
+    "import_seconds": "import orm_converter.tortoise_to_django",
+    "converted_model_import_seconds": "from orm_converter.tortoise_to_django import ConvertedModel",
+}
+
+
+def _run(*args: str) -> str:
+    return subprocess.run(
+        [sys.executable, *args], check=True, stdout=subprocess.PIPE, universal_newlines=True
+    ).stdout.strip()
+
+
+def measure_import_seconds(statement: str, repeat: int = 5) -> float:
+    code = IMPORT_TIME_CODE.format(statement=statement)
+
+    return statistics.median(float(_run("-c", code)) for _ in range(repeat))
+
+
+def measure_conversion(models_count: int) -> Dict[str, float]:
+    result = json.loads(_run("-m", "benchmarks.conversion", str(models_count)))
+    result.update(json.loads(_run("-m", "benchmarks.conversion", str(models_count), "--trace-memory")))
+
+    return result
+
+
+def run(scales: List[int]) -> Dict[str, Dict[str, float]]:
+    results = {"import": {name: measure_import_seconds(statement) for name, statement in IMPORT_STATEMENTS.items()}}
+
+    for models_count in scales:
+        results[f"models_{models_count}"] = measure_conversion(models_count)
+
+    return results
+
+
+def compare(
+    results: Dict[str, Dict[str, float]], baselines: Dict[str, Dict[str, float]], tolerance: float
+) -> List[str]:
+    regressions = []
+
+    for case, metrics in results.items():
+        for metric, value in metrics.items():
+            baseline = baselines.get(case, {}).get(metric)
+
+            if baseline is None:
+                print(f"{case}.{metric}: {value:.4g} (no baseline)")
+                continue
+
+            ratio = value / baseline if baseline else 1.0
+            print(f"{case}.{metric}: {value:.4g} (baseline: {baseline:.4g}, x{ratio:.2f})")
+
+            if ratio > tolerance:
+                regressions.append(f"{case}.{metric}")
+
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(prog="python -m benchmarks")
+    parser.add_argument("--scale", type=int, action="append", help="Number of models. Default: 10, 1000, 10000.")
+    parser.add_argument("--tolerance", type=float, default=1.5, help="Allowed ratio to the baseline. Default: 1.5.")
+    parser.add_argument("--check", action="store_true", help="Exit with 1 if there are regressions.")
+    parser.add_argument(
+        "--baselines", default=BASELINES_PATH, help="Baselines file. Default: benchmarks/baselines.json."
+    )
+    parser.add_argument("--update-baselines", action="store_true")
+    args = parser.parse_args()
+
+    results = run(args.scale or list(DEFAULT_SCALES))
+
+    baselines: Dict[str, Dict[str, float]] = {}
+
+    if os.path.exists(args.baselines):
+        with open(args.baselines, "r") as f:
+            baselines = json.load(f)
+
+    if args.update_baselines:
+        baselines.update(results)
+
+        with open(args.baselines, "w") as f:
+            json.dump(baselines, f, indent=4, sort_keys=True)
+            f.write("\n")
+
+        return
+
+    regressions = compare(results, baselines, tolerance=args.tolerance)
+
+    if regressions:
+        print(f"Regressions: {', '.join(regressions)}")
+
+        if args.check:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+"""
+Measures the conversion of a synthetic schema, prints the result as json.
+Runs in a separate process for each measurement, so the measurements don't affect each other.
+"""
+import argparse
+import json
+import tracemalloc
+from time import perf_counter
+
+import django
+from django.conf import settings
+
+
+def measure(models_count: int, trace_memory: bool = False) -> dict:
+    settings.configure()
+    django.setup()
+
+    from benchmarks.schema import generate_models
+    from orm_converter.tortoise_to_django import convert_app
+
+    started_at = perf_counter()
+    models = generate_models(models_count)
+    schema_seconds = perf_counter() - started_at
+
+    if trace_memory:
+        tracemalloc.start()
+
+    started_at = perf_counter()
+    convert_app(models)
+    conversion_seconds = perf_counter() - started_at
+
+    if trace_memory:
+        _, peak_memory = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        return {"conversion_peak_memory": peak_memory}
+
+    return {"schema_seconds": schema_seconds, "conversion_seconds": conversion_seconds}
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("models_count", type=int)
+    parser.add_argument("--trace-memory", action="store_true", help="Measure the peak memory instead of the time.")
+    args = parser.parse_args()
+
+    print(json.dumps(measure(args.models_count, trace_memory=args.trace_memory)))
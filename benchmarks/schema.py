@@ -0,0 +1,61 @@
+import random
+from typing import List, Type
+
+from tortoise import fields as tortoise_fields
+from tortoise.models import Model as TortoiseModel
+
+from orm_converter.tortoise_to_django import LazyConvertedModel
+
+APP_LABEL = "benchmark"
+
+
+def _get_data_fields() -> dict:
+    # one field per converter from `Converter._FIELDS_RATIO`
+    return {
+        "big_int_field": tortoise_fields.BigIntField(index=True),
+        "binary_field": tortoise_fields.BinaryField(null=True),
+        "boolean_field": tortoise_fields.BooleanField(default=False),
+        "char_field": tortoise_fields.CharField(max_length=255, null=True, description="Char field"),
+        "date_field": tortoise_fields.DateField(null=True),
+        "datetime_field": tortoise_fields.DatetimeField(auto_now_add=True),
+        "decimal_field": tortoise_fields.DecimalField(max_digits=10, decimal_places=2, default=0),
+        "float_field": tortoise_fields.FloatField(null=True),
+        "int_field": tortoise_fields.IntField(unique=True),
+        "json_field": tortoise_fields.JSONField(null=True),
+        "small_int_field": tortoise_fields.SmallIntField(default=0),
+        "text_field": tortoise_fields.TextField(null=True),
+        "uuid_field": tortoise_fields.UUIDField(null=True),
+    }
+
+
+def generate_models(count: int, seed: int = 0) -> List[Type[TortoiseModel]]:
+    """
+    Generates `count` models with all supported fields,
+    up to 3 foreign keys, a one-to-one field and a many-to-many field to the previously generated models.
+    """
+    rng = random.Random(seed)
+    models: List[Type[TortoiseModel]] = []
+
+    meta_type = type("Meta", (), {"app_label": APP_LABEL})
+
+    for index in range(count):
+        model_name = f"BenchmarkModel{index}"
+        attributes = {"Meta": meta_type, "__module__": __name__, **_get_data_fields()}
+
+        if models:
+            for fk_index in range(min(3, len(models))):
+                related_model = rng.choice(models)
+                attributes[f"fk_{fk_index}"] = tortoise_fields.ForeignKeyField(
+                    f"{APP_LABEL}.{related_model.__name__}", related_name=f"{model_name}_fk_{fk_index}", null=True
+                )
+
+            attributes["o2o"] = tortoise_fields.OneToOneField(
+                f"{APP_LABEL}.{rng.choice(models).__name__}", related_name=f"{model_name}_o2o", null=True
+            )
+            attributes["m2m"] = tortoise_fields.ManyToManyField(
+                f"{APP_LABEL}.{rng.choice(models).__name__}", related_name=f"{model_name}_m2m"
+            )
+
+        models.append(type(model_name, (TortoiseModel, LazyConvertedModel), attributes))  # type: ignore
+
+    return models
@@ -0,0 +1,3 @@
+from orm_converter.cli import main
+
+main()
@@ -1,8 +1,14 @@
 from abc import ABC, ABCMeta, abstractmethod
-from typing import Dict, Type
+from functools import cached_property
+from threading import RLock
+from types import MappingProxyType
+from typing import Dict, Mapping, Optional, Tuple, Type
 
 
 class BaseFieldConverter(ABC):
+    dropped_kwargs: Tuple[str, ...] = ()
+    # filled only while the conversion is profiled
+
     def __init__(self, original_field: object):
         if not isinstance(original_field, self.ORIGINAL_FIELD_TYPE):
             raise TypeError(
@@ -12,7 +18,17 @@ class BaseFieldConverter(ABC):
             )
 
         self._original_field = original_field
-        self._original_field_kwargs = original_field.__dict__.copy()
+
+    @cached_property
+    def _original_field_kwargs(self) -> dict:
+        # created on first access only, converters may extract the kwargs without copying
+        return self._original_field.__dict__.copy()
+
+    @classmethod
+    def clear_cache(cls):
+        """
+        Drops the data cached for the converter class.
+        """
 
     @property
     @abstractmethod
@@ -31,13 +47,27 @@ class BaseFieldConverter(ABC):
 
 
 class BaseConverter(ABC):
+    """
+    The registry of the field converters (`_FIELDS_RATIO`) is copy-on-write:
+    registrations publish a new read-only mapping under the lock, conversions read it without locking.
+    """
+
+    _registry_lock = RLock()
+    _resolved_converters_cache: Dict[
+        Tuple[type, type], Tuple[Mapping[Type[object], Type[BaseFieldConverter]], Optional[Type[BaseFieldConverter]]]
+    ] = {}
+    # (converter type, field type): (registry the converter was resolved with, field converter)
+
     def __init__(self, original_model_type: Type[object]):
         self._original_model_type = original_model_type
-        self._original_model_type_attributes = original_model_type.__dict__.copy()
+
+    @cached_property
+    def _original_model_type_attributes(self) -> dict:
+        return self._original_model_type.__dict__.copy()
 
     @property
     @abstractmethod
-    def _FIELDS_RATIO(self) -> Dict[Type[object], Type[BaseFieldConverter]]:
+    def _FIELDS_RATIO(self) -> Mapping[Type[object], Type[BaseFieldConverter]]:
         pass
 
     @property
@@ -45,24 +75,91 @@ class BaseConverter(ABC):
     def converted_model(self):
         pass
 
+    @classmethod
+    def _get_fields_ratio(cls) -> Mapping[Type[object], Type[BaseFieldConverter]]:
+        return cls._FIELDS_RATIO  # type: ignore
+
     @classmethod
     def add_converters(cls, *converters: Type[BaseFieldConverter]):
-        for converter in converters:
-            cls._FIELDS_RATIO[converter.ORIGINAL_FIELD_TYPE] = converter  # type: ignore
+        with cls._registry_lock:
+            fields_ratio = dict(cls._get_fields_ratio())
+
+            for converter in converters:
+                converter.clear_cache()
+                fields_ratio[converter.ORIGINAL_FIELD_TYPE] = converter  # type: ignore
+
+            cls._FIELDS_RATIO = MappingProxyType(fields_ratio)  # type: ignore
+            cls.clear_cache()
+
+    @classmethod
+    def clear_cache(cls):
+        """
+        Drops the data cached for the converter class.
+        """
+        cls._resolved_converters_cache.clear()
+
+    @classmethod
+    def get_field_converter(cls, field_type: type) -> Optional[Type[BaseFieldConverter]]:
+        """
+        Returns the converter registered for the nearest class in the `field_type` MRO.
+        """
+        key = (cls, field_type)
+        fields_ratio = cls._get_fields_ratio()
+        resolved = cls._resolved_converters_cache.get(key)
+
+        if resolved is not None and resolved[0] is fields_ratio:
+            return resolved[1]
+
+        converter = None
+
+        for field_base_type in field_type.__mro__:
+            converter = fields_ratio.get(field_base_type)
+
+            if converter is not None:
+                break
+
+        cls._resolved_converters_cache[key] = (fields_ratio, converter)
+
+        return converter
 
 
 class BaseConvertedModelMeta(ABCMeta):
+    lazy_conversion: bool = False
+
     def __new__(mcs, *args, **kwargs):
         cls = super().__new__(mcs, *args, **kwargs)  # type: ignore
 
-        if issubclass(cls, mcs.model_type_to_convert):  # NOQA
-            converted_model = mcs.default_converter(cls).converted_model  # NOQA type: ignore
-            cls._converted_model = converted_model
-        else:
-            cls._converted_model = None
+        cls._converted_model = None
+        cls._is_converted = False
+        cls._conversion_lock = RLock()
+        # per model, so the first conversions of different models don't wait for each other
+
+        if not mcs.lazy_conversion:
+            cls.warm()
 
         return cls
 
+    def warm(cls, converter=None):
+        """
+        Converts the model if it hasn't been converted yet and returns the converted model.
+        `converter` replaces the default converter of the model.
+        """
+        if cls._is_converted:
+            return cls._converted_model
+
+        with cls._conversion_lock:
+            if not cls._is_converted:
+                # converted in another thread while waiting for the lock
+                if issubclass(cls, type(cls).model_type_to_convert):  # NOQA
+                    if converter is None:
+                        converter = type(cls).default_converter(cls)  # NOQA type: ignore
+
+                    cls._converted_model = converter.converted_model  # type: ignore
+
+                cls._is_converted = True
+
+        return cls._converted_model
+
     @property
     @abstractmethod
     def default_converter(cls) -> Type[object]:
@@ -0,0 +1,70 @@
+import argparse
+import json
+from importlib import import_module
+from typing import List, Optional, Sequence
+
+
+def _load_tortoise_config(path: str) -> dict:
+    if path.endswith(".json"):
+        with open(path, "r") as f:
+            return json.load(f)
+
+    module_name, _, attribute_name = path.rpartition(".")
+
+    return getattr(import_module(module_name), attribute_name)
+
+
+def _get_modules(args: argparse.Namespace) -> List[str]:
+    modules: List[str] = list(args.module or [])
+
+    if args.config:
+        apps = _load_tortoise_config(args.config)["apps"]
+
+        for app_name in args.app or apps.keys():
+            modules.extend(module for module in apps[app_name]["models"] if module != "aerich.models")
+
+    return modules
+
+
+def codegen(args: argparse.Namespace):
+    from orm_converter.tortoise_to_django.codegen import (
+        generate_modules_source, setup_django)
+
+    setup_django()
+
+    source = generate_modules_source(_get_modules(args), workers=args.jobs or None)
+
+    if args.output == "-":
+        print(source, end="")
+    else:
+        with open(args.output, "w") as f:
+            f.write(source)
+
+
+def get_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="orm-converter")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    codegen_parser = subparsers.add_parser("codegen", help="Generate django `models.py` from tortoise models.")
+    codegen_parser.add_argument(
+        "-c", "--config", help='Tortoise config: "package.module.CONFIG" or path to a json file.'
+    )
+    codegen_parser.add_argument("-a", "--app", action="append", help="Tortoise app from the config. Default: all.")
+    codegen_parser.add_argument("-m", "--module", action="append", help="Module with tortoise models.")
+    codegen_parser.add_argument(
+        "-j", "--jobs", type=int, default=1, help="Number of processes, 0 - number of CPUs. Default: 1."
+    )
+    codegen_parser.add_argument("-o", "--output", default="-", help="Output file. Default: stdout.")
+    codegen_parser.set_defaults(handler=codegen)
+
+    return parser
+
+
+def main(argv: Optional[Sequence[str]] = None):
+    parser = get_parser()
+    args = parser.parse_args(argv)
+
+    if args.command == "codegen" and not (args.config or args.module):
+        parser.error("codegen: one of the arguments -c/--config -m/--module is required")
+
+    args.handler(args)
@@ -0,0 +1,86 @@
+from contextvars import ContextVar, Token
+from time import perf_counter
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+_active_profilers: ContextVar[Tuple["ConversionProfiler", ...]] = ContextVar("active_profilers", default=())
+# per context, so the conversions of other threads and asyncio tasks aren't recorded
+
+
+class FieldConversionRecord(NamedTuple):
+    model_name: str
+    field_name: str
+    converter_name: str
+    seconds: float
+    dropped_kwargs: Tuple[str, ...]
+
+
+class ModelConversionRecord(NamedTuple):
+    model_name: str
+    seconds: float
+    plan_seconds: float
+    plan_source: str
+    # "built" or "memory"
+    fields_count: int
+
+
+class ConversionProfiler:
+    """
+    Records the conversions made inside the `with` block, in the same thread or asyncio task.
+    Override `on_field` and `on_model` to get the records as they are made.
+    """
+
+    def __init__(self) -> None:
+        self.fields: List[FieldConversionRecord] = []
+        self.models: List[ModelConversionRecord] = []
+
+        self._started_at: Optional[float] = None
+        self._seconds = 0.0
+        self._tokens: List[Token] = []
+
+    def __enter__(self) -> "ConversionProfiler":
+        self._started_at = perf_counter()
+        self._tokens.append(_active_profilers.set((*_active_profilers.get(), self)))
+
+        return self
+
+    def __exit__(self, *args):
+        _active_profilers.reset(self._tokens.pop())
+
+        if self._started_at is not None:
+            self._seconds += perf_counter() - self._started_at
+            self._started_at = None
+
+    def on_field(self, record: FieldConversionRecord):
+        self.fields.append(record)
+
+    def on_model(self, record: ModelConversionRecord):
+        self.models.append(record)
+
+    def report(self) -> Dict[str, Any]:
+        fields_by_model: Dict[str, List[Dict[str, Any]]] = {}
+
+        for field_record in self.fields:
+            fields_by_model.setdefault(field_record.model_name, []).append(field_record._asdict())
+
+        return {
+            "seconds": self._seconds,
+            "models_seconds": sum(record.seconds for record in self.models),
+            "models": [
+                dict(record._asdict(), fields=fields_by_model.get(record.model_name, []))
+                for record in sorted(self.models, key=lambda record: record.seconds, reverse=True)
+            ],
+        }
+
+
+def is_profiling() -> bool:
+    return bool(_active_profilers.get())
+
+
+def record_field(record: FieldConversionRecord):
+    for profiler in _active_profilers.get():
+        profiler.on_field(record)
+
+
+def record_model(record: ModelConversionRecord):
+    for profiler in _active_profilers.get():
+        profiler.on_model(record)
@@ -1,3 +1,6 @@
+import os
+
+
 def dict_intersection(*dicts: dict) -> dict:
     comm_keys = dicts[0].keys()
 
@@ -5,3 +8,12 @@ def dict_intersection(*dicts: dict) -> dict:
         comm_keys &= _dict.keys()  # type: ignore
 
     return {key: dicts[0][key] for key in comm_keys}
+
+
+def write_atomically(path: str, data: bytes):
+    temp_path = f"{path}.{os.getpid()}.tmp"
+
+    with open(temp_path, "wb") as f:
+        f.write(data)
+
+    os.replace(temp_path, path)
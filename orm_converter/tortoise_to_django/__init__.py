@@ -1,4 +1,57 @@
-from .field_converter import (BaseTortoiseFieldConverter,
-                              BaseTortoiseRelationalFieldConverter)
-from .model_converter import (ConvertedModel, ConvertedModelMeta, Converter,
-                              RedefinedAttributes)
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .app_converter import convert_app, convert_registry
+    from .async_bridge import AsyncModel, DjangoExecutor, aiterate
+    from .conversion_plan import ConversionPlan
+    from .copier import TableCopier
+    from .databases import get_databases
+    from .field_converter import (BaseTortoiseFieldConverter,
+                                  BaseTortoiseRelationalFieldConverter)
+    from .fingerprint import (get_django_model_fingerprint,
+                              get_model_fingerprint)
+    from .model_converter import (ConvertedModel, ConvertedModelMeta,
+                                  Converter, LazyConvertedModel,
+                                  LazyConvertedModelMeta, RedefinedAttributes)
+    from .sharded_copy import copy_sharded
+    from .transcoder import ReverseTranscoder, Transcoder
+
+_LAZY_ATTRIBUTES = {
+    "convert_app": "app_converter",
+    "convert_registry": "app_converter",
+    "AsyncModel": "async_bridge",
+    "DjangoExecutor": "async_bridge",
+    "aiterate": "async_bridge",
+    "ConversionPlan": "conversion_plan",
+    "TableCopier": "copier",
+    "get_databases": "databases",
+    "get_django_model_fingerprint": "fingerprint",
+    "get_model_fingerprint": "fingerprint",
+    "BaseTortoiseFieldConverter": "field_converter",
+    "BaseTortoiseRelationalFieldConverter": "field_converter",
+    "ConvertedModel": "model_converter",
+    "ConvertedModelMeta": "model_converter",
+    "Converter": "model_converter",
+    "LazyConvertedModel": "model_converter",
+    "LazyConvertedModelMeta": "model_converter",
+    "RedefinedAttributes": "model_converter",
+    "copy_sharded": "sharded_copy",
+    "ReverseTranscoder": "transcoder",
+    "Transcoder": "transcoder",
+}
+
+__all__ = list(_LAZY_ATTRIBUTES)
+
+
+def __getattr__(name: str) -> Any:
+    # the submodules are imported on first use, so importing the package doesn't import django
+    module_name = _LAZY_ATTRIBUTES.get(name)
+
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(import_module(f"{__name__}.{module_name}"), name)
+    globals()[name] = value
+
+    return value
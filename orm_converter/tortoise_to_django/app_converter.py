@@ -0,0 +1,270 @@
+from heapq import heapify, heappop, heappush
+from importlib import import_module
+from typing import (Dict, Iterable, Iterator, List, Mapping, Optional, Set,
+                    Tuple, Type)
+
+from django.db.models import Model as DjangoModel
+from tortoise.fields import relational as tortoise_relational_fields
+from tortoise.models import Model as TortoiseModel
+
+from orm_converter.bases import BaseConvertedModelMeta
+from orm_converter.tortoise_to_django.model_converter import Converter
+
+_RELATIONAL_FIELDS_TYPES = (
+    tortoise_relational_fields.ForeignKeyFieldInstance,
+    tortoise_relational_fields.ManyToManyFieldInstance,
+)
+
+
+def convert_registry(
+    apps: Mapping[str, Mapping[str, Type[TortoiseModel]]], converter_type: Type[Converter] = Converter
+) -> Dict[Type[TortoiseModel], Optional[Type[DjangoModel]]]:
+    """
+    Converts all models of `Tortoise.apps`.
+    """
+    return convert_app(
+        (model for app_models in apps.values() for model in app_models.values()), converter_type=converter_type
+    )
+
+
+def get_tortoise_models(modules: Iterable[str]) -> List[Type[TortoiseModel]]:
+    """
+    Collects the tortoise models in the same way as `Tortoise.init` does.
+    """
+    models: List[Type[TortoiseModel]] = []
+
+    for module_name in modules:
+        module = import_module(module_name)
+        possible_models = getattr(module, "__models__", None) or [getattr(module, name) for name in dir(module)]
+
+        for model in possible_models:
+            if (
+                isinstance(model, type)
+                and issubclass(model, TortoiseModel)
+                and not model._meta.abstract
+                and model not in models
+            ):
+                models.append(model)
+
+    return models
+
+
+def convert_app(
+    models: Iterable[Type[TortoiseModel]], converter_type: Type[Converter] = Converter, app_label: Optional[str] = None
+) -> Dict[Type[TortoiseModel], Optional[Type[DjangoModel]]]:
+    """
+    Converts the models in one pass.
+    The models are converted after the models they refer to,
+    so django resolves the relations immediately instead of postponing them.
+    `app_label` overrides `Meta.app_label` of the models that haven't been converted yet.
+    """
+    models = sort_models(models)
+    relations = None if app_label is None else _get_relations(models, app_label)
+
+    converted_models: Dict[Type[TortoiseModel], Optional[Type[DjangoModel]]] = {}
+
+    for model in models:
+        converter = converter_type(model, app_label=app_label, relations=relations)
+
+        if isinstance(model, BaseConvertedModelMeta):
+            converted_models[model] = model.warm(converter)  # type: ignore
+        else:
+            converted_models[model] = converter.converted_model
+
+    return converted_models
+
+
+def sort_models(models: Iterable[Type[TortoiseModel]]) -> List[Type[TortoiseModel]]:
+    """
+    Sorts the models topologically by the foreign keys.
+    The order of the definition is kept where possible, models in reference cycles keep their order.
+    """
+    models = list(dict.fromkeys(models))
+    dependencies = get_dependencies(models)
+    indexes = {model: index for index, model in enumerate(models)}
+
+    components = [_sort_cycle(component, dependencies, indexes) for component in _get_cycles(models, dependencies)]
+    # a model out of cycles is a component of its own
+    component_numbers = {model: number for number, component in enumerate(components) for model in component}
+    first_indexes = [min(indexes[model] for model in component) for component in components]
+
+    dependents: List[Set[int]] = [set() for _ in components]
+    in_degrees = [0] * len(components)
+
+    for number, component in enumerate(components):
+        for model in component:
+            for dependency in dependencies[model]:
+                dependency_number = component_numbers[dependency]
+
+                if dependency_number != number and number not in dependents[dependency_number]:
+                    dependents[dependency_number].add(number)
+                    in_degrees[number] += 1
+
+    ready = [(first_indexes[number], number) for number in range(len(components)) if not in_degrees[number]]
+    heapify(ready)
+    # the ready components are taken in the order of the definition
+
+    sorted_models: List[Type[TortoiseModel]] = []
+
+    while ready:
+        _, number = heappop(ready)
+        sorted_models.extend(components[number])
+
+        for dependent in dependents[number]:
+            in_degrees[dependent] -= 1
+
+            if not in_degrees[dependent]:
+                heappush(ready, (first_indexes[dependent], dependent))
+
+    return sorted_models
+
+
+def _sort_cycle(
+    component: List[Type[TortoiseModel]],
+    dependencies: Dict[Type[TortoiseModel], Set[Type[TortoiseModel]]],
+    indexes: Dict[Type[TortoiseModel], int],
+) -> List[Type[TortoiseModel]]:
+    if len(component) == 1:
+        return component
+
+    component = sorted(component, key=indexes.__getitem__)
+    positions = {model: position for position, model in enumerate(component)}
+    dependents: Dict[Type[TortoiseModel], List[Type[TortoiseModel]]] = {model: [] for model in component}
+    in_degrees = dict.fromkeys(component, 0)
+
+    for model in component:
+        for dependency in dependencies[model]:
+            if dependency in positions:
+                dependents[dependency].append(model)
+                in_degrees[model] += 1
+
+    ready: List[int] = []
+    sorted_models: List[Type[TortoiseModel]] = []
+    added: Set[Type[TortoiseModel]] = set()
+    first_not_added = 0
+
+    while len(sorted_models) < len(component):
+        if ready:
+            model = component[heappop(ready)]
+
+            if model in added:
+                continue
+        else:
+            # take the first model left in the cycle, django resolves its relations lazily
+            while component[first_not_added] in added:
+                first_not_added += 1
+
+            model = component[first_not_added]
+
+        sorted_models.append(model)
+        added.add(model)
+
+        for dependent in dependents[model]:
+            in_degrees[dependent] -= 1
+
+            if not in_degrees[dependent]:
+                heappush(ready, positions[dependent])
+
+    return sorted_models
+
+
+def _get_cycles(
+    models: List[Type[TortoiseModel]], dependencies: Dict[Type[TortoiseModel], Set[Type[TortoiseModel]]]
+) -> List[List[Type[TortoiseModel]]]:
+    """
+    Splits the models into the strongly connected components (Tarjan's algorithm without recursion).
+    """
+    visit_indexes: Dict[Type[TortoiseModel], int] = {}
+    low_links: Dict[Type[TortoiseModel], int] = {}
+    stack: List[Type[TortoiseModel]] = []
+    on_stack: Set[Type[TortoiseModel]] = set()
+    components: List[List[Type[TortoiseModel]]] = []
+
+    def visit(model: Type[TortoiseModel]) -> Tuple[Type[TortoiseModel], Iterator[Type[TortoiseModel]]]:
+        visit_indexes[model] = low_links[model] = len(visit_indexes)
+        stack.append(model)
+        on_stack.add(model)
+
+        return model, iter(dependencies[model])
+
+    for root in models:
+        if root in visit_indexes:
+            continue
+
+        path = [visit(root)]
+
+        while path:
+            model, model_dependencies = path[-1]
+
+            for dependency in model_dependencies:
+                if dependency not in visit_indexes:
+                    path.append(visit(dependency))
+                    break
+
+                if dependency in on_stack:
+                    low_links[model] = min(low_links[model], visit_indexes[dependency])
+            else:
+                path.pop()
+
+                if path:
+                    parent = path[-1][0]
+                    low_links[parent] = min(low_links[parent], low_links[model])
+
+                if low_links[model] == visit_indexes[model]:
+                    component: List[Type[TortoiseModel]] = []
+
+                    while not component or component[-1] is not model:
+                        component.append(stack.pop())
+                        on_stack.discard(component[-1])
+
+                    components.append(component)
+
+    return components
+
+
+def get_dependencies(models: Iterable[Type[TortoiseModel]]) -> Dict[Type[TortoiseModel], Set[Type[TortoiseModel]]]:
+    """
+    Returns the models each model refers to, only the models from `models` are taken into account.
+    """
+    models = list(models)
+    dependencies: Dict[Type[TortoiseModel], Set[Type[TortoiseModel]]] = {model: set() for model in models}
+
+    for model, _, related_model in _iterate_relations(models):
+        if related_model is not model:
+            dependencies[model].add(related_model)
+
+    return dependencies
+
+
+def _get_relations(models: List[Type[TortoiseModel]], app_label: str) -> Dict[str, str]:
+    # references to the converted models are redirected to the django app
+    return {
+        model_name: f"{app_label}.{related_model.__name__}"
+        for _, model_name, related_model in _iterate_relations(models)
+    }
+
+
+def _iterate_relations(
+    models: List[Type[TortoiseModel]],
+) -> Iterator[Tuple[Type[TortoiseModel], str, Type[TortoiseModel]]]:
+    """
+    Yields (model, related model name, related model) for the relations between `models`.
+    """
+    models_by_name: Dict[str, Type[TortoiseModel]] = {}
+
+    for model in models:
+        models_by_name.setdefault(model.__name__, model)
+
+        if model._meta.app:
+            models_by_name[f"{model._meta.app}.{model.__name__}"] = model
+
+    for model in models:
+        for field in model._meta.fields_map.values():
+            if not isinstance(field, _RELATIONAL_FIELDS_TYPES) or Converter._is_generated_by_tortoise(field):
+                continue
+
+            model_name: str = field.model_name  # type: ignore
+            related_model = models_by_name.get(model_name) or models_by_name.get(model_name.rpartition(".")[2])
+
+            if related_model is not None:
+                yield model, model_name, related_model
@@ -0,0 +1,34 @@
+from typing import Sequence, Type
+
+from django.apps import AppConfig
+
+from orm_converter.tortoise_to_django.app_converter import (
+    convert_app, get_tortoise_models)
+from orm_converter.tortoise_to_django.model_converter import Converter
+
+
+class TortoiseModelsConfig(AppConfig):
+    """
+    Builds the django models of the tortoise models from `tortoise_modules` in `apps.populate()`.
+    The tortoise models don't need to be `ConvertedModel`,
+    so the modules can be imported without django settings in the processes that don't use django.
+    Models converted on import (`ConvertedModel`) keep their own `Meta.app_label`.
+
+    Usage:
+        class MyAppConfig(TortoiseModelsConfig):
+            name = "my_app"
+            tortoise_modules = ["my_app.tortoise_models"]
+    """
+
+    default_auto_field = "django.db.models.AutoField"
+    # the same as the default tortoise pk (`IntField(pk=True)`)
+
+    tortoise_modules: Sequence[str] = ()
+    converter_type: Type[Converter] = Converter
+
+    def import_models(self):
+        super().import_models()
+
+        convert_app(
+            get_tortoise_models(self.tortoise_modules), converter_type=self.converter_type, app_label=self.label
+        )
@@ -0,0 +1,248 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from functools import partial
+from threading import Barrier, Event, Lock
+from typing import (Any, AsyncIterator, Callable, Iterable, List, NamedTuple,
+                    Optional, Type, TypeVar)
+
+from django.db import close_old_connections, connections
+from django.db.models import Model as DjangoModel
+
+T = TypeVar("T")
+
+_default_executor: Optional["DjangoExecutor"] = None
+_default_executor_lock = Lock()
+
+_END = object()
+_STOP_CHECK_INTERVAL = 0.1
+
+
+class ExecutorMetrics(NamedTuple):
+    queued: int
+    running: int
+    completed: int
+    max_queued: int
+
+
+class DjangoExecutor:
+    """
+    Bounded thread pool for the django queries made from asyncio code.
+    Django connections are thread-local, so each thread reuses its connections between the calls,
+    the expired or broken connections are closed before each call, like django does between requests.
+    """
+
+    def __init__(self, max_workers: int = 4):
+        self.max_workers = max_workers
+
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="orm-converter-django", initializer=self._add_thread
+        )
+        self._lock = Lock()
+        self._threads_count = 0
+        self._pending = 0
+        self._running = 0
+        self._completed = 0
+        self._max_queued = 0
+
+    async def run(self, function: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        with self._lock:
+            self._pending += 1
+            self._max_queued = max(self._max_queued, self._pending - self._running)
+
+        try:
+            return await asyncio.get_running_loop().run_in_executor(
+                self._executor, partial(self._call, function, *args, **kwargs)
+            )
+        finally:
+            with self._lock:
+                self._pending -= 1
+                self._completed += 1
+
+    @property
+    def metrics(self) -> ExecutorMetrics:
+        with self._lock:
+            return ExecutorMetrics(
+                queued=self._pending - self._running,
+                running=self._running,
+                completed=self._completed,
+                max_queued=self._max_queued,
+            )
+
+    def shutdown(self):
+        """
+        Closes the connections of the threads and stops them.
+        """
+        with self._lock:
+            threads_count = self._threads_count
+
+        if threads_count:
+            # the barrier makes each thread take one of the tasks
+            barrier = Barrier(threads_count)
+            futures = [self._executor.submit(_close_connections, barrier) for _ in range(threads_count)]
+
+            for future in futures:
+                future.result()
+
+        self._executor.shutdown(wait=True)
+
+    def _add_thread(self):
+        with self._lock:
+            self._threads_count += 1
+
+    def _call(self, function: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        with self._lock:
+            self._running += 1
+
+        try:
+            close_old_connections()
+
+            return function(*args, **kwargs)
+        finally:
+            with self._lock:
+                self._running -= 1
+
+
+class AsyncModel:
+    """
+    Async facade over the django model (or the converted model of `ConvertedModel`),
+    the queries are made in `DjangoExecutor` threads.
+    """
+
+    def __init__(self, model_type: type, executor: Optional[DjangoExecutor] = None, using: Optional[str] = None):
+        if not issubclass(model_type, DjangoModel):
+            model_type = model_type.DjangoModel  # type: ignore
+
+        self.model_type: Type[DjangoModel] = model_type
+        self.executor = executor or get_default_executor()
+        self.using = using
+
+    @property
+    def objects(self) -> Any:
+        return self.model_type._default_manager.db_manager(self.using)
+
+    async def aget(self, *args: Any, **kwargs: Any) -> DjangoModel:
+        return await self.executor.run(lambda: self.objects.get(*args, **kwargs))
+
+    async def afilter(self, *args: Any, **kwargs: Any) -> List[DjangoModel]:
+        return await self.executor.run(lambda: list(self.objects.filter(*args, **kwargs)))
+
+    async def acount(self, *args: Any, **kwargs: Any) -> int:
+        return await self.executor.run(lambda: self.objects.filter(*args, **kwargs).count())
+
+    async def aexists(self, *args: Any, **kwargs: Any) -> bool:
+        return await self.executor.run(lambda: self.objects.filter(*args, **kwargs).exists())
+
+    async def acreate(self, **kwargs: Any) -> DjangoModel:
+        return await self.executor.run(lambda: self.objects.create(**kwargs))
+
+    async def abulk_create(
+        self, instances: Iterable[DjangoModel], batch_size: Optional[int] = None
+    ) -> List[DjangoModel]:
+        return await self.executor.run(lambda: self.objects.bulk_create(instances, batch_size=batch_size))
+
+    async def abulk_update(
+        self, instances: Iterable[DjangoModel], fields: List[str], batch_size: Optional[int] = None
+    ) -> Any:
+        return await self.executor.run(lambda: self.objects.bulk_update(instances, fields, batch_size=batch_size))
+
+    async def aupdate(self, filters: dict, **values: Any) -> int:
+        return await self.executor.run(lambda: self.objects.filter(**filters).update(**values))
+
+    async def adelete(self, *args: Any, **kwargs: Any) -> int:
+        deleted, _ = await self.executor.run(lambda: self.objects.filter(*args, **kwargs).delete())
+        return deleted
+
+    def aiterate(self, *args: Any, chunk_size: int = 2000, max_chunks: int = 2, **kwargs: Any) -> AsyncIterator:
+        return aiterate(self.objects.filter(*args, **kwargs), chunk_size, max_chunks)
+
+
+def get_default_executor() -> DjangoExecutor:
+    """
+    Returns the executor shared by `AsyncModel` instances created without an executor.
+    """
+    global _default_executor
+
+    if _default_executor is None:
+        with _default_executor_lock:
+            if _default_executor is None:
+                _default_executor = DjangoExecutor()
+
+    return _default_executor
+
+
+async def aiterate(queryset: Any, chunk_size: int = 2000, max_chunks: int = 2) -> AsyncIterator:
+    """
+    Iterates over `queryset.iterator(chunk_size)` in a thread of its own.
+    The rows are passed by chunks through a queue of `max_chunks` chunks, the thread waits while the queue is full.
+    The thread isn't taken from `DjangoExecutor`, so the consumer can query the executor while the thread waits.
+    The cursor is closed when the iteration is cancelled or the iterator is closed with `aclose()`.
+    """
+    loop = asyncio.get_running_loop()
+    queue: asyncio.Queue = asyncio.Queue(maxsize=max_chunks)
+    stopped = Event()
+
+    def put(item: Any) -> bool:
+        if stopped.is_set():
+            return False
+
+        future = asyncio.run_coroutine_threadsafe(queue.put(item), loop)
+
+        # the stop is checked periodically, because the loop may not run the put after the consumer is gone
+        while not stopped.is_set():
+            try:
+                future.result(timeout=_STOP_CHECK_INTERVAL)
+                return True
+            except FutureTimeoutError:
+                pass
+
+        future.cancel()
+        return False
+
+    def produce():
+        rows = queryset.iterator(chunk_size=chunk_size)
+
+        try:
+            chunk = []
+
+            for row in rows:
+                chunk.append(row)
+
+                if len(chunk) == chunk_size:
+                    if not put(chunk):
+                        return
+
+                    chunk = []
+
+            if chunk:
+                put(chunk)
+        finally:
+            rows.close()
+            connections.close_all()
+            put(_END)
+
+    thread = ThreadPoolExecutor(max_workers=1, thread_name_prefix="orm-converter-aiterate")
+    producer = loop.run_in_executor(thread, produce)
+    # the thread stops after `produce`
+    thread.shutdown(wait=False)
+
+    try:
+        while True:
+            chunk = await queue.get()
+
+            if chunk is _END:
+                break
+
+            for row in chunk:
+                yield row
+
+        # raises the errors of the iteration
+        await producer
+    finally:
+        stopped.set()
+        await asyncio.wait([producer])
+
+
+def _close_connections(barrier: Barrier):
+    barrier.wait()
+    connections.close_all()
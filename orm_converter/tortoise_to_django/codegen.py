@@ -0,0 +1,124 @@
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple, Type
+
+from django.db.migrations.serializer import serializer_factory
+from django.db.models.fields import Field as DjangoField
+from tortoise.models import Model as TortoiseModel
+
+from orm_converter.tortoise_to_django.app_converter import get_tortoise_models
+from orm_converter.tortoise_to_django.model_converter import Converter
+
+HEADER = "# Generated by orm-converter codegen. Do not edit manually.\n"
+INDENT = " " * 4
+
+
+def generate_models_source(models: Iterable[Type[TortoiseModel]]) -> str:
+    """
+    Generates the source of a django `models.py`.
+    Only fields and `Meta` are generated, methods and other attributes are not transferred.
+    """
+    imports: Set[str] = {"from django.db import models"}
+    classes_sources: List[str] = []
+
+    for model in models:
+        class_source, class_imports = _generate_model_source(model)
+
+        classes_sources.append(class_source)
+        imports.update(class_imports)
+
+    return _join_source(imports, classes_sources)
+
+
+def generate_modules_source(modules: Sequence[str], workers: Optional[int] = 1) -> str:
+    """
+    Generates the source of a django `models.py` from the models of `modules`.
+    Each module is processed in a separate process if `workers` isn't 1,
+    the result doesn't depend on the number of workers.
+    """
+    if workers == 1 or len(modules) < 2:
+        modules_results = [_generate_module_source(module_name) for module_name in modules]
+    else:
+        with ProcessPoolExecutor(max_workers=workers, initializer=setup_django) as executor:
+            modules_results = list(executor.map(_generate_module_source, modules))
+
+    imports: Set[str] = {"from django.db import models"}
+    classes_sources: Dict[str, str] = {}
+
+    for module_imports, module_classes_sources in modules_results:
+        imports.update(module_imports)
+
+        for model_path, class_source in module_classes_sources:
+            classes_sources.setdefault(model_path, class_source)
+            # the model can be imported in several modules
+
+    return _join_source(imports, classes_sources.values())
+
+
+def setup_django():
+    import django
+    from django.conf import settings
+
+    if not settings.configured:
+        settings.configure()
+
+    django.setup()
+
+
+def _generate_module_source(module_name: str) -> Tuple[Set[str], List[Tuple[str, str]]]:
+    imports: Set[str] = set()
+    classes_sources: List[Tuple[str, str]] = []
+
+    for model in get_tortoise_models([module_name]):
+        class_source, class_imports = _generate_model_source(model)
+
+        classes_sources.append((f"{model.__module__}.{model.__qualname__}", class_source))
+        imports.update(class_imports)
+
+    return imports, classes_sources
+
+
+def _join_source(imports: Iterable[str], classes_sources: Iterable[str]) -> str:
+    return HEADER + "\n".join(sorted(imports, key=lambda line: (line.startswith("from"), line))) + "\n\n\n" + (
+        "\n\n".join(classes_sources)
+    )
+
+
+def _generate_model_source(model: Type[TortoiseModel]) -> Tuple[str, Set[str]]:
+    plan = Converter(model).plan
+
+    imports: Set[str] = set()
+    lines = [f"class {plan.model_name}(models.Model):"]
+
+    fields = {
+        **{name: value for name, value in plan.attributes.items() if isinstance(value, DjangoField)},
+        **plan.build_fields(),
+    }
+    # fields redefined with `RedefinedAttributes` are passed with the attributes
+
+    for field_name, field in fields.items():
+        field_source, field_imports = serializer_factory(field).serialize()
+
+        lines.append(f"{INDENT}{field_name} = {field_source}")
+        imports.update(field_imports)
+
+    meta_attributes = {
+        name: value
+        for name, value in plan.meta_attributes.items()
+        if not (name.startswith("__") and name.endswith("__"))
+    }
+
+    if meta_attributes:
+        if len(lines) > 1:
+            lines.append("")
+
+        lines.append(f"{INDENT}class Meta:")
+
+        for name, value in meta_attributes.items():
+            value_source, value_imports = serializer_factory(value).serialize()
+
+            lines.append(f"{INDENT * 2}{name} = {value_source}")
+            imports.update(value_imports)
+    elif len(lines) == 1:
+        lines.append(f"{INDENT}pass")
+
+    return "\n".join(lines) + "\n", imports
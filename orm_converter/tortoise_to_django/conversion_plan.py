@@ -0,0 +1,61 @@
+from copy import deepcopy
+from typing import Any, Dict, Mapping, Optional, Tuple, Type
+
+from django.db.models import Model as DjangoModel
+from django.db.models.fields import Field as DjangoField
+
+FieldPlan = Tuple[Type[DjangoField], Dict[str, Any]]
+
+
+class ConversionPlan:
+    """
+    The result of the tortoise model analysis.
+    It can be executed any number of times, each execution builds a new django model.
+    """
+
+    def __init__(
+        self,
+        model_name: str,
+        attributes: Dict[str, Any],
+        fields: Dict[str, FieldPlan],
+        meta_attributes: Dict[str, Any],
+    ):
+        self.model_name = model_name
+        self.attributes = attributes
+        self.fields = fields
+        self.meta_attributes = meta_attributes
+
+    def build_fields(self, relations: Optional[Mapping[str, str]] = None) -> Dict[str, DjangoField]:
+        """
+        :param relations: replacements for the `to` kwargs of the relational fields.
+        """
+        if not relations:
+            return {field_name: field_type(**kwargs) for field_name, (field_type, kwargs) in self.fields.items()}
+
+        fields = {}
+
+        for field_name, (field_type, kwargs) in self.fields.items():
+            to = kwargs.get("to")
+
+            if isinstance(to, str) and to in relations:
+                kwargs = {**kwargs, "to": relations[to]}
+
+            fields[field_name] = field_type(**kwargs)
+
+        return fields
+
+    def execute(self, relations: Optional[Mapping[str, str]] = None, **meta_attributes: Any) -> Type[DjangoModel]:
+        """
+        :param relations: replacements for the `to` kwargs of the relational fields.
+        :param meta_attributes: `Meta` attributes to override.
+        """
+        attributes = {
+            name: deepcopy(value) if isinstance(value, DjangoField) else value
+            for name, value in self.attributes.items()
+        }
+        # redefined fields are copied, so the same field isn't bound to several models
+
+        attributes["Meta"] = type("Meta", (), {**self.meta_attributes, **meta_attributes})
+        attributes.update(self.build_fields(relations))
+
+        return type(self.model_name, (DjangoModel,), attributes)  # type: ignore
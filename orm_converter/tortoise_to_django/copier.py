@@ -0,0 +1,203 @@
+import asyncio
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, Awaitable, Callable, List, Optional, Type
+
+from django.db import connections, transaction
+from django.db.models import Model as DjangoModel
+from tortoise.models import Model as TortoiseModel
+
+from orm_converter.shared.utils import write_atomically
+from orm_converter.tortoise_to_django.transcoder import (ReverseTranscoder,
+                                                         Transcoder)
+
+TO_DJANGO = "to_django"
+TO_TORTOISE = "to_tortoise"
+
+
+class TableCopier:
+    """
+    Copies the rows of a tortoise model table to the table of its converted django model, or back.
+    The rows are read by chunks in the primary key order, so the memory usage doesn't depend on the table size.
+    The last copied primary key is stored in `checkpoint` file, so an interrupted copy is resumed from it.
+    The file is removed when the copy is finished.
+    """
+
+    def __init__(
+        self,
+        tortoise_model_type: Type[TortoiseModel],
+        django_model_type: Optional[Type[DjangoModel]] = None,
+        chunk_size: int = 1000,
+        checkpoint: Optional[str] = None,
+        update_existing: bool = False,
+        using: str = "default",
+        after_pk: Any = None,
+        until_pk: Any = None,
+    ):
+        """
+        :param checkpoint: path of the file with the copy progress.
+        :param update_existing: update the rows that already exist in the target table instead of failing.
+        :param using: django database alias.
+        :param after_pk: copy only the rows with greater primary keys.
+        :param until_pk: copy only the rows with lower or equal primary keys.
+        """
+        self.transcoder = Transcoder(tortoise_model_type, django_model_type)
+        self.reverse_transcoder = ReverseTranscoder(tortoise_model_type, django_model_type)
+        self.tortoise_model_type = tortoise_model_type
+        self.django_model_type = self.transcoder.django_model_type
+        self.chunk_size = chunk_size
+        self.checkpoint = checkpoint
+        self.update_existing = update_existing
+        self.using = using
+        self.after_pk = after_pk
+        self.until_pk = until_pk
+
+        self._tortoise_pk = tortoise_model_type._meta.pk_attr
+        self._django_pk = self.django_model_type._meta.pk
+        self._django_update_fields = [
+            attname for _, attname in self.transcoder.attributes if attname != self._django_pk.attname
+        ]
+
+    async def copy_to_django(self) -> int:
+        """
+        Returns the number of the copied rows.
+        """
+        return await self._copy(TO_DJANGO)
+
+    async def copy_to_tortoise(self) -> int:
+        """
+        Returns the number of the copied rows.
+        """
+        return await self._copy(TO_TORTOISE)
+
+    async def _copy(self, direction: str) -> int:
+        loop = asyncio.get_running_loop()
+        last_pk = self._load_checkpoint(direction)
+        copied = 0
+
+        # django connections are thread-local, so all the django queries of the copy run in one thread
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            read_chunk: Callable[[Any], Awaitable[List]]
+            write_chunk: Callable[[List], Awaitable[None]]
+
+            if direction == TO_DJANGO:
+                read_chunk = self._read_tortoise_chunk
+                write_chunk = partial(loop.run_in_executor, executor, self._write_django_chunk)  # type: ignore
+            else:
+                read_chunk = partial(loop.run_in_executor, executor, self._read_django_chunk)  # type: ignore
+                write_chunk = self._write_tortoise_chunk
+
+            try:
+                while True:
+                    chunk = await read_chunk(last_pk)
+
+                    if not chunk:
+                        break
+
+                    await write_chunk(chunk)
+
+                    copied += len(chunk)
+                    last_pk = chunk[-1].pk
+                    self._store_checkpoint(direction, last_pk)
+
+                    if len(chunk) < self.chunk_size:
+                        break
+            finally:
+                await loop.run_in_executor(executor, connections.close_all)
+
+        if self.checkpoint is not None and os.path.exists(self.checkpoint):
+            os.remove(self.checkpoint)
+
+        return copied
+
+    async def _read_tortoise_chunk(self, last_pk: Any) -> List[DjangoModel]:
+        queryset = self.tortoise_model_type.all()
+
+        if last_pk is not None:
+            queryset = queryset.filter(**{f"{self._tortoise_pk}__gt": last_pk})
+
+        if self.until_pk is not None:
+            queryset = queryset.filter(**{f"{self._tortoise_pk}__lte": self.until_pk})
+
+        instances = await queryset.order_by(self._tortoise_pk).limit(self.chunk_size)
+
+        return self.transcoder.transcode_batch(instances)
+
+    def _write_django_chunk(self, chunk: List[DjangoModel]):
+        manager = self.django_model_type._default_manager.db_manager(self.using)
+
+        with transaction.atomic(using=self.using):
+            if self.update_existing:
+                pks = [instance.pk for instance in chunk]
+                existing_pks = set(manager.filter(pk__in=pks).values_list("pk", flat=True))
+                existing = [instance for instance in chunk if instance.pk in existing_pks]
+
+                if existing and self._django_update_fields:
+                    manager.bulk_update(existing, self._django_update_fields)
+
+                chunk = [instance for instance in chunk if instance.pk not in existing_pks]
+
+            manager.bulk_create(chunk)
+
+    def _read_django_chunk(self, last_pk: Any) -> List[TortoiseModel]:
+        queryset = self.django_model_type._default_manager.db_manager(self.using).order_by("pk")
+
+        if last_pk is not None:
+            queryset = queryset.filter(pk__gt=last_pk)
+
+        if self.until_pk is not None:
+            queryset = queryset.filter(pk__lte=self.until_pk)
+
+        rows = queryset.values_list(*self.reverse_transcoder.fields)[: self.chunk_size]
+
+        return list(self.reverse_transcoder.transcode_rows(rows))
+
+    async def _write_tortoise_chunk(self, chunk: List[TortoiseModel]):
+        if self.update_existing:
+            existing_pks = set(
+                await self.tortoise_model_type.filter(
+                    **{f"{self._tortoise_pk}__in": [instance.pk for instance in chunk]}
+                ).values_list(self._tortoise_pk, flat=True)
+            )
+
+            # `bulk_update` of tortoise inlines the raw attribute values into the query text
+            # without `to_db_value`, so JSON, UUID and enum values can't be written with it
+            for instance in chunk:
+                if instance.pk in existing_pks:
+                    await instance.save(force_update=True)
+
+            chunk = [instance for instance in chunk if instance.pk not in existing_pks]
+
+        for instance in chunk:
+            # the primary keys are copied, so they must be inserted
+            instance._saved_in_db = False
+            instance._custom_generated_pk = True
+
+        await self.tortoise_model_type.bulk_create(chunk)
+
+    def _load_checkpoint(self, direction: str) -> Any:
+        if self.checkpoint is None:
+            return self.after_pk
+
+        try:
+            with open(self.checkpoint, "r") as f:
+                state = json.load(f)
+        except (OSError, ValueError):
+            return self.after_pk
+
+        if state.get("model") != self._get_model_path() or state.get("direction") != direction:
+            return self.after_pk
+
+        return self._django_pk.to_python(state["last_pk"])
+
+    def _store_checkpoint(self, direction: str, last_pk: Any):
+        if self.checkpoint is None:
+            return
+
+        state = {"model": self._get_model_path(), "direction": direction, "last_pk": last_pk}
+        write_atomically(self.checkpoint, json.dumps(state, default=str).encode())
+
+    def _get_model_path(self) -> str:
+        return f"{self.tortoise_model_type.__module__}.{self.tortoise_model_type.__qualname__}"
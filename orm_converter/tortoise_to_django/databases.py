@@ -0,0 +1,112 @@
+from typing import Any, Dict, Optional, Union
+
+from django.db.backends.signals import connection_created
+from tortoise.backends.base.config_generator import expand_db_url
+
+ENGINES = {
+    "tortoise.backends.asyncpg": "django.db.backends.postgresql",
+    "tortoise.backends.psycopg": "django.db.backends.postgresql",
+    "tortoise.backends.mysql": "django.db.backends.mysql",
+    "tortoise.backends.sqlite": "django.db.backends.sqlite3",
+}
+
+_NOT_PRAGMAS = ("file_path", "connection_name", "fetch_inserted")
+
+
+def get_databases(
+    config: Optional[Dict[str, Any]] = None,
+    db_url: Optional[str] = None,
+    conn_max_age: int = 600,
+    server_side_cursors: bool = True,
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Returns django `DATABASES` for the connections of the tortoise `config` (or for `db_url` as "default").
+    The tortoise pool sizes (`minsize`, `maxsize`) are dropped, django has no connection pool,
+    the connections are persistent instead.
+    :param conn_max_age: lifetime of the persistent connections.
+    :param server_side_cursors: allow server-side cursors in `QuerySet.iterator()`,
+        disable them for the transaction pooling (e.g. pgbouncer).
+    """
+    if db_url is not None:
+        connections: Dict[str, Any] = {"default": db_url}
+    elif config is not None:
+        connections = config["connections"]
+    else:
+        raise ValueError("Either config or db_url must be passed.")
+
+    return {
+        alias: get_database(connection, conn_max_age, server_side_cursors)
+        for alias, connection in connections.items()
+    }
+
+
+def get_database(
+    connection: Union[str, Dict[str, Any]],
+    conn_max_age: int = 600,
+    server_side_cursors: bool = True,
+) -> Dict[str, Any]:
+    """
+    Returns django database settings for the tortoise connection (db url or dict with engine and credentials).
+    SQLite pragmas are put in the `SQLITE_PRAGMAS` key, django doesn't use it,
+    the pragmas are set on the new connections after `enable_sqlite_pragmas()`.
+    MySQL gets only the credentials and `charset`.
+    """
+    if isinstance(connection, str):
+        connection = expand_db_url(connection)
+
+    engine = ENGINES.get(connection["engine"])
+
+    if engine is None:
+        raise ValueError(f"{connection['engine']} engine is not supported.")
+
+    credentials = dict(connection["credentials"])
+    database: Dict[str, Any] = {"ENGINE": engine, "CONN_MAX_AGE": conn_max_age, "OPTIONS": {}}
+
+    if engine == "django.db.backends.sqlite3":
+        pragmas = {name: value for name, value in credentials.items() if name not in _NOT_PRAGMAS}
+        pragmas.setdefault("journal_mode", "WAL")
+        pragmas.setdefault("journal_size_limit", 16384)
+        # the same as tortoise sets, see `_set_sqlite_pragmas`
+
+        database.update(NAME=credentials["file_path"], SQLITE_PRAGMAS=pragmas)
+        return database
+
+    database.update(
+        NAME=credentials.get("database"),
+        USER=credentials.get("user"),
+        PASSWORD=credentials.get("password"),
+        HOST=credentials.get("host"),
+        PORT=credentials.get("port"),
+    )
+
+    if engine == "django.db.backends.mysql":
+        if "charset" in credentials:
+            database["OPTIONS"]["charset"] = credentials["charset"]
+
+        return database
+
+    database["DISABLE_SERVER_SIDE_CURSORS"] = not server_side_cursors
+
+    if credentials.get("ssl"):
+        database["OPTIONS"]["sslmode"] = "require"
+
+    return database
+
+
+def enable_sqlite_pragmas():
+    """
+    Sets `SQLITE_PRAGMAS` of the database settings on each new SQLite connection.
+    Call it once, e.g. in `AppConfig.ready()`.
+    """
+    connection_created.connect(_set_sqlite_pragmas, dispatch_uid="orm_converter_sqlite_pragmas")
+
+
+def _set_sqlite_pragmas(sender: Any, connection: Any, **kwargs: Any):
+    pragmas = connection.settings_dict.get("SQLITE_PRAGMAS")
+
+    if connection.vendor != "sqlite" or not pragmas:
+        return
+
+    with connection.cursor() as cursor:
+        for name, value in pragmas.items():
+            cursor.execute(f"PRAGMA {name}={value}")
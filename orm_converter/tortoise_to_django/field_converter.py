@@ -1,37 +1,192 @@
 from abc import ABC
 from inspect import getfullargspec
-from typing import Callable, Dict
+from typing import (Any, Callable, Dict, FrozenSet, Iterable, Optional, Tuple,
+                    Type)
 
 from django.db import models as django_models
 from django.db.models import NOT_PROVIDED
 from django.db.models import fields as django_fields
 from tortoise import fields as tortoise_fields
+from tortoise import validators as tortoise_validators
 from tortoise.fields import relational
 
 from orm_converter import bases
-from orm_converter.shared.utils import dict_intersection
+from orm_converter.shared.profiling import is_profiling
+
+AttributesMap = Tuple[Tuple[str, str], ...]
 
 
 class BaseTortoiseFieldConverter(bases.BaseFieldConverter, ABC):
+    _RENAMED_ATTRIBUTES: Dict[str, str] = {
+        # django kwarg: tortoise attribute
+        "primary_key": "pk",
+        "verbose_name": "description",
+        "db_index": "index",
+    }
+    _IGNORED_ATTRIBUTES: FrozenSet[str] = frozenset({"validators"})
+    # Can't process the custom validators
+    _DERIVED_VALIDATORS: Tuple[type, ...] = ()
+    # the validators tortoise adds from the other kwargs, they aren't reported as dropped
+    _INTERNAL_KWARGS: FrozenSet[str] = frozenset({"model", "related_model"})
+    # set by tortoise, not by the field definition
+
+    _accepted_kwargs_cache: Dict[type, FrozenSet[str]] = {}
+    _attributes_map_cache: Dict[type, Optional[AttributesMap]] = {}
+    _original_kwargs_defaults_cache: Dict[type, Dict[str, Any]] = {}
+    # tortoise field type: {kwarg: default}
+
     @property
     def converted_field(self) -> django_fields.Field:
         return self.CONVERTED_FIELD_TYPE(**self._converted_field_kwargs)  # type: ignore
 
+    @property
+    def converted_field_plan(self) -> Tuple[Type[django_fields.Field], dict]:
+        return self.CONVERTED_FIELD_TYPE, self._converted_field_kwargs  # type: ignore
+
     @property
     def _converted_field_kwargs(self) -> dict:
+        attributes_map = self._get_attributes_map()
+
+        if attributes_map is None:
+            return self._get_reformatted_kwargs()
+
+        attributes = self._original_field.__dict__
+        kwargs = {kwarg: attributes[attribute] for kwarg, attribute in attributes_map if attribute in attributes}
+
+        self._reformat_extracted_kwargs(kwargs)
+
+        if is_profiling():
+            self.dropped_kwargs = self._get_dropped_kwargs(attribute for _, attribute in attributes_map)
+
+        return kwargs
+
+    def _get_reformatted_kwargs(self) -> dict:
+        # the path for converters that redefine `_reformat_kwargs`
         self._reformat_kwargs()
 
-        spec = getfullargspec(self.CONVERTED_FIELD_TYPE)
+        accepted_kwargs = self._get_accepted_kwargs()
+
+        if is_profiling():
+            self.dropped_kwargs = self._get_dropped_kwargs(
+                self._RENAMED_ATTRIBUTES.get(kwarg, kwarg) for kwarg in accepted_kwargs
+            )
+
+        return {key: value for key, value in self._original_field_kwargs.items() if key in accepted_kwargs}
+
+    def _get_dropped_kwargs(self, used_attributes: Iterable[str]) -> Tuple[str, ...]:
+        """
+        Returns the constructor kwargs of the tortoise field that aren't converted and aren't left at their defaults.
+        """
+        used_attributes = set(used_attributes)
+        attributes = self._original_field.__dict__
+        dropped_kwargs = []
+
+        for name, default in self._get_original_kwargs_defaults(type(self._original_field)).items():
+            if name not in attributes or name in used_attributes or name in self._INTERNAL_KWARGS:
+                continue
+
+            value = attributes[name]
+
+            if name == "validators":
+                value = [validator for validator in value if not isinstance(validator, self._DERIVED_VALIDATORS)]
+
+            if value != default and not (default is None and not value):
+                dropped_kwargs.append(name)
+
+        return tuple(dropped_kwargs)
+
+    @classmethod
+    def _get_original_kwargs_defaults(cls, field_type: type) -> Dict[str, Any]:
+        defaults = cls._original_kwargs_defaults_cache.get(field_type)
+
+        if defaults is None:
+            defaults = {}
+
+            for base in field_type.__mro__:
+                if "__init__" not in base.__dict__:
+                    continue
+
+                spec = getfullargspec(base.__dict__["__init__"])
+                args = spec.args[1:]
+                args_defaults = spec.defaults or ()
+                required_args = args[: len(args) - len(args_defaults)]
 
-        kwargs = dict(zip(spec.args[1:], spec.args[1:]))
-        # the value of kwargs does not matter because it will be replaced with
-        # values from `self._original_field_kwargs`
+                defaults.update((arg, NOT_PROVIDED) for arg in required_args if arg not in defaults)
+                defaults.update(
+                    (arg, default) for arg, default in zip(args[len(required_args):], args_defaults)
+                    if arg not in defaults
+                )
 
-        if spec.varkw:
-            base_field_spec = getfullargspec(django_fields.Field)
-            kwargs.update(zip(base_field_spec.args[1:], base_field_spec.args[1:]))
+                if not spec.varkw:
+                    break
 
-        return dict_intersection(self._original_field_kwargs, kwargs)
+            cls._original_kwargs_defaults_cache[field_type] = defaults
+
+        return defaults
+
+    @classmethod
+    def _get_accepted_kwargs(cls) -> FrozenSet[str]:
+        accepted_kwargs = cls._accepted_kwargs_cache.get(cls)
+
+        if accepted_kwargs is None:
+            spec = getfullargspec(cls.CONVERTED_FIELD_TYPE)
+            kwargs = set(spec.args[1:])
+
+            if spec.varkw:
+                kwargs.update(getfullargspec(django_fields.Field).args[1:])
+
+            accepted_kwargs = cls._accepted_kwargs_cache[cls] = frozenset(kwargs)
+
+        return accepted_kwargs
+
+    @classmethod
+    def _get_attributes_map(cls) -> Optional[AttributesMap]:
+        """
+        Returns pairs of the django kwarg and the tortoise attribute it's taken from,
+        or `None` if the converter redefines `_reformat_kwargs`.
+        """
+        try:
+            return cls._attributes_map_cache[cls]
+        except KeyError:
+            pass
+
+        attributes_map: Optional[AttributesMap] = None
+
+        if not cls._redefines_reformat_kwargs():
+            attributes_map = tuple(
+                (kwarg, cls._RENAMED_ATTRIBUTES.get(kwarg, kwarg))
+                for kwarg in sorted(cls._get_accepted_kwargs())
+                if cls._RENAMED_ATTRIBUTES.get(kwarg, kwarg) not in cls._IGNORED_ATTRIBUTES
+            )
+
+        cls._attributes_map_cache[cls] = attributes_map
+
+        return attributes_map
+
+    @classmethod
+    def _redefines_reformat_kwargs(cls) -> bool:
+        for base in cls.__mro__:
+            if "_reformat_kwargs" in base.__dict__:
+                return base not in (BaseTortoiseFieldConverter, BaseTortoiseRelationalFieldConverter)
+
+        return False
+
+    @classmethod
+    def clear_cache(cls):
+        cls._accepted_kwargs_cache.pop(cls, None)
+        cls._attributes_map_cache.pop(cls, None)
+
+    def _reformat_extracted_kwargs(self, kwargs: dict):
+        """
+        The same as `_reformat_kwargs`, but `kwargs` already contain only the django kwargs.
+        """
+        accepted_kwargs = self._get_accepted_kwargs()
+
+        if kwargs.get("null", False) is True and "blank" in accepted_kwargs:
+            kwargs["blank"] = True
+
+        if kwargs.get("default") is None and "default" in accepted_kwargs:
+            kwargs["default"] = NOT_PROVIDED
 
     def _reformat_kwargs(self):
         self._original_field_kwargs["primary_key"] = self._original_field_kwargs.get("pk", False)
@@ -44,11 +199,16 @@ class BaseTortoiseFieldConverter(bases.BaseFieldConverter, ABC):
         if self._original_field_kwargs.get("default") is None:
             self._original_field_kwargs["default"] = NOT_PROVIDED
 
-        self._original_field_kwargs.pop("validators", None)
-        # Can't process the custom validators
+        for attribute in self._IGNORED_ATTRIBUTES:
+            self._original_field_kwargs.pop(attribute, None)
 
 
 class BaseTortoiseRelationalFieldConverter(BaseTortoiseFieldConverter, ABC):
+    _RENAMED_ATTRIBUTES = {
+        **BaseTortoiseFieldConverter._RENAMED_ATTRIBUTES,
+        "to": "model_name",
+    }
+
     _on_delete_functions_ratio: Dict[str, Callable] = {
         "CASCADE": django_models.CASCADE,
         "RESTRICT": django_models.RESTRICT,
@@ -56,6 +216,12 @@ class BaseTortoiseRelationalFieldConverter(BaseTortoiseFieldConverter, ABC):
         "SET DEFAULT": django_models.SET_DEFAULT,
     }
 
+    def _reformat_extracted_kwargs(self, kwargs: dict):
+        super()._reformat_extracted_kwargs(kwargs)
+
+        if "on_delete" in kwargs:
+            kwargs["on_delete"] = self._on_delete_functions_ratio.get(kwargs["on_delete"])
+
     def _reformat_kwargs(self):
         super()._reformat_kwargs()
 
@@ -90,6 +256,8 @@ class CharFieldConverter(BaseTortoiseFieldConverter):
     ORIGINAL_FIELD_TYPE = tortoise_fields.CharField
     CONVERTED_FIELD_TYPE = django_fields.CharField
 
+    _DERIVED_VALIDATORS = (tortoise_validators.MaxLengthValidator,)
+
 
 class DateFieldConverter(BaseTortoiseFieldConverter):
     ORIGINAL_FIELD_TYPE = tortoise_fields.DateField
@@ -120,6 +288,9 @@ class JSONFieldConverter(BaseTortoiseFieldConverter):
     ORIGINAL_FIELD_TYPE = tortoise_fields.JSONField
     CONVERTED_FIELD_TYPE = django_models.JSONField
 
+    _IGNORED_ATTRIBUTES = BaseTortoiseFieldConverter._IGNORED_ATTRIBUTES | {"encoder", "decoder"}
+    # Tortoise keeps the `json.dumps`/`json.loads` functions there, django expects the encoder/decoder classes
+
 
 class SmallIntFieldConverter(BaseTortoiseFieldConverter):
     ORIGINAL_FIELD_TYPE = tortoise_fields.SmallIntField
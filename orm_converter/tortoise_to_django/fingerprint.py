@@ -0,0 +1,80 @@
+import hashlib
+from typing import Any, Dict, Iterable, Mapping, Tuple, Type
+
+from django.db.migrations.serializer import serializer_factory
+from django.db.models import Model as DjangoModel
+from django.db.models.fields import Field as DjangoField
+from tortoise.models import Model as TortoiseModel
+
+from orm_converter.tortoise_to_django.model_converter import Converter
+
+FINGERPRINT_VERSION = 1
+
+SCHEMA_META_ATTRIBUTES = ("db_table", "unique_together", "index_together", "indexes", "constraints", "managed")
+
+
+def get_model_fingerprint(model_type: Type[TortoiseModel], converter_type: Type[Converter] = Converter) -> str:
+    """
+    Returns the fingerprint of the django schema `model_type` is converted to.
+    It's equal to the fingerprint of the converted model, so it can be compared with the deployed one
+    without building the django model.
+    """
+    plan = converter_type(model_type).plan
+    fields = {
+        **{name: value for name, value in plan.attributes.items() if isinstance(value, DjangoField)},
+        **plan.build_fields(),
+    }
+
+    return _get_fingerprint(fields.items(), plan.meta_attributes)
+
+
+def get_django_model_fingerprint(model_type: Type[DjangoModel]) -> str:
+    """
+    Returns the fingerprint of the django model schema: fields, table name, indexes and relations.
+    Fields created by django (e.g. the default `id`) are ignored.
+    """
+    meta = model_type._meta
+    fields = [
+        (field.name, field)
+        for field in (*meta.local_fields, *meta.local_many_to_many)
+        if not field.auto_created
+    ]
+
+    return _get_fingerprint(fields, meta.original_attrs)
+
+
+def _get_fingerprint(fields: Iterable[Tuple[str, DjangoField]], meta_attributes: Mapping[str, Any]) -> str:
+    parts = [f"{FINGERPRINT_VERSION}"]
+
+    for field_name, field in sorted(fields, key=lambda item: item[0]):
+        _, path, args, kwargs = field.deconstruct()
+        parts.append(f"{field_name} = {path}({_serialize(args)}, {_serialize(_normalize_field_kwargs(kwargs))})")
+
+    for name in SCHEMA_META_ATTRIBUTES:
+        if name in meta_attributes:
+            parts.append(f"Meta.{name} = {_serialize(meta_attributes[name])}")
+
+    return hashlib.sha256("\n".join(parts).encode()).hexdigest()
+
+
+def _normalize_field_kwargs(kwargs: Dict[str, Any]) -> Dict[str, Any]:
+    # set by django for the primary keys of the model classes, it doesn't affect the schema
+    kwargs.pop("serialize", None)
+
+    to = kwargs.get("to")
+
+    if isinstance(to, str):
+        # the app label of the related model depends on the app the models are converted to
+        kwargs["to"] = to.rsplit(".", 1)[-1].lower()
+
+    return kwargs
+
+
+def _serialize(value: Any) -> str:
+    try:
+        source, _ = serializer_factory(value).serialize()
+    except ValueError:
+        # e.g. lambdas as default values, such models can't have migrations either
+        return repr(value)
+
+    return source
@@ -1,8 +1,8 @@
 from inspect import isclass
-from typing import Any, Dict, Optional, Type
+from time import perf_counter
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Dict, Mapping, Optional, Tuple, Type
 
-from django.db.models import Model as DjangoModel
-from django.db.models.fields import Field as DjangoField
 from tortoise import fields as tortoise_fields
 from tortoise.fields import Field as TortoiseField
 from tortoise.fields import relational as tortoise_relational_fields
@@ -12,7 +12,20 @@ from tortoise.models import ModelMeta as TortoiseModelMeta
 
 from orm_converter.bases import BaseConvertedModelMeta, BaseConverter
 from orm_converter.shared.exceptions import FieldIsNotSupported
-from orm_converter.tortoise_to_django import field_converter
+from orm_converter.shared.profiling import (FieldConversionRecord,
+                                            ModelConversionRecord,
+                                            is_profiling, record_field,
+                                            record_model)
+
+if TYPE_CHECKING:
+    from django.db.models import Model as DjangoModel
+
+    from orm_converter.tortoise_to_django.conversion_plan import (
+        ConversionPlan, FieldPlan)
+    from orm_converter.tortoise_to_django.field_converter import \
+        BaseTortoiseFieldConverter
+
+# django is imported on the first conversion, see `Converter._get_default_fields_ratio`
 
 
 class RedefinedAttributes:
@@ -24,89 +37,234 @@ class RedefinedAttributes:
 
 
 class Converter(BaseConverter):
-    _FIELDS_RATIO: Dict[Type[TortoiseField], Type[field_converter.BaseTortoiseFieldConverter]] = {  # type: ignore
-        tortoise_fields.BigIntField: field_converter.BigIntFieldConverter,
-        tortoise_fields.BinaryField: field_converter.BinaryFieldConverter,
-        tortoise_fields.BooleanField: field_converter.BooleanFieldConverter,
-        tortoise_fields.CharField: field_converter.CharFieldConverter,
-        tortoise_fields.DateField: field_converter.DateFieldConverter,
-        tortoise_fields.DatetimeField: field_converter.DatetimeFieldConverter,
-        tortoise_fields.DecimalField: field_converter.DecimalFieldConverter,
-        tortoise_fields.FloatField: field_converter.FloatFieldConverter,
-        tortoise_fields.IntField: field_converter.IntFieldConverter,
-        tortoise_fields.JSONField: field_converter.JSONFieldConverter,
-        tortoise_fields.SmallIntField: field_converter.SmallIntFieldConverter,
-        tortoise_fields.TextField: field_converter.TextFieldConverter,
-        tortoise_fields.UUIDField: field_converter.UUIDFieldConverter,
-        tortoise_relational_fields.ForeignKeyFieldInstance: field_converter.ForeignKeyFieldConverter,
-        tortoise_relational_fields.OneToOneFieldInstance: field_converter.OneToOneFieldConverter,
-        tortoise_relational_fields.ManyToManyFieldInstance: field_converter.ManyToManyFieldConverter,
-    }
-
-    def __init__(self, original_model_type: Type[TortoiseModel]):
+    _FIELDS_RATIO: Optional[Mapping[Type[TortoiseField], Type["BaseTortoiseFieldConverter"]]] = None  # type: ignore
+    # filled on first use, see `_get_default_fields_ratio`
+
+    _plans_cache: Dict[Tuple[type, type], Tuple[Mapping, "ConversionPlan"]] = {}
+    # (converter type, model type): (registry the plan was built with, plan)
+
+    lean = False
+    # if `True`, the django model gets only the fields, `Meta` and redefined attributes
+    # and the conversion plans aren't kept in memory
+
+    _LEAN_ATTRIBUTES = ("__module__", "__qualname__", "__doc__")
+
+    def __init__(
+        self,
+        original_model_type: Type[TortoiseModel],
+        app_label: Optional[str] = None,
+        relations: Optional[Mapping[str, str]] = None,
+    ):
+        """
+        :param app_label: django app of the converted model, overrides `Meta.app_label`.
+        :param relations: replacements for the related models names, e.g. {"models.User": "accounts.User"}.
+        """
         super().__init__(original_model_type)
 
+        self._execute_kwargs: Dict[str, Any] = {"relations": relations}
+
+        if app_label is not None:
+            self._execute_kwargs["app_label"] = app_label
+
         self._redefined_attributes: Dict[str, Any] = {}
+        self._plan_source = "memory"
 
-        for attribute in self._original_model_type_attributes.values():
+        for attribute in vars(original_model_type).values():
             if isclass(attribute) and issubclass(attribute, RedefinedAttributes):
-                self._redefined_attributes.update(attribute.__dict__)
+                self._redefined_attributes.update(
+                    (name, value)
+                    for name, value in attribute.__dict__.items()
+                    if not (name.startswith("__") and name.endswith("__"))
+                )
+
+    @classmethod
+    def _get_fields_ratio(cls) -> Mapping[Type[TortoiseField], Type["BaseTortoiseFieldConverter"]]:  # type: ignore
+        if cls._FIELDS_RATIO is None:
+            with cls._registry_lock:
+                if Converter._FIELDS_RATIO is None:
+                    Converter._FIELDS_RATIO = MappingProxyType(cls._get_default_fields_ratio())
+
+        return cls._FIELDS_RATIO  # type: ignore
+
+    @staticmethod
+    def _get_default_fields_ratio() -> Dict[Type[TortoiseField], Type["BaseTortoiseFieldConverter"]]:
+        from orm_converter.tortoise_to_django import field_converter
+
+        return {
+            tortoise_fields.BigIntField: field_converter.BigIntFieldConverter,
+            tortoise_fields.BinaryField: field_converter.BinaryFieldConverter,
+            tortoise_fields.BooleanField: field_converter.BooleanFieldConverter,
+            tortoise_fields.CharField: field_converter.CharFieldConverter,
+            tortoise_fields.DateField: field_converter.DateFieldConverter,
+            tortoise_fields.DatetimeField: field_converter.DatetimeFieldConverter,
+            tortoise_fields.DecimalField: field_converter.DecimalFieldConverter,
+            tortoise_fields.FloatField: field_converter.FloatFieldConverter,
+            tortoise_fields.IntField: field_converter.IntFieldConverter,
+            tortoise_fields.JSONField: field_converter.JSONFieldConverter,
+            tortoise_fields.SmallIntField: field_converter.SmallIntFieldConverter,
+            tortoise_fields.TextField: field_converter.TextFieldConverter,
+            tortoise_fields.UUIDField: field_converter.UUIDFieldConverter,
+            tortoise_relational_fields.ForeignKeyFieldInstance: field_converter.ForeignKeyFieldConverter,
+            tortoise_relational_fields.OneToOneFieldInstance: field_converter.OneToOneFieldConverter,
+            tortoise_relational_fields.ManyToManyFieldInstance: field_converter.ManyToManyFieldConverter,
+        }
+
+    @property
+    def converted_model(self) -> Optional[Type["DjangoModel"]]:
+        if is_profiling():
+            return self._get_profiled_converted_model()
+
+        return self.plan.execute(**self._execute_kwargs)
 
     @property
-    def converted_model(self) -> Optional[Type[DjangoModel]]:
+    def plan(self) -> "ConversionPlan":
+        self._plan_source = "memory"
+        fields_ratio = self._get_fields_ratio()
+        cache_key = (type(self), self._original_model_type)
+        # lean plans aren't cached, and the cached full plans have the attributes lean plans must not have
+        cached_plan = None if self.lean else self._plans_cache.get(cache_key)
+
+        if cached_plan is not None and cached_plan[0] is fields_ratio:
+            plan = cached_plan[1]
+        else:
+            plan = self._build_plan()
+            self._plan_source = "built"
+
+            if not self.lean:
+                self._plans_cache[cache_key] = (fields_ratio, plan)
+
+        return plan
+
+    @classmethod
+    def clear_cache(cls):
+        super().clear_cache()
+        cls._plans_cache.clear()
+
+    def _get_profiled_converted_model(self) -> Type["DjangoModel"]:
+        started_at = perf_counter()
+        plan = self.plan
+        plan_seconds = perf_counter() - started_at
+
+        converted_model = plan.execute(**self._execute_kwargs)
+
+        record_model(
+            ModelConversionRecord(
+                model_name=self._model_path,
+                seconds=perf_counter() - started_at,
+                plan_seconds=plan_seconds,
+                plan_source=self._plan_source,
+                fields_count=len(plan.fields),
+            )
+        )
+
+        return converted_model
+
+    @property
+    def _model_path(self) -> str:
+        return f"{self._original_model_type.__module__}.{self._original_model_type.__qualname__}"
+
+    def _build_plan(self) -> "ConversionPlan":
+        from orm_converter.tortoise_to_django.conversion_plan import \
+            ConversionPlan
+
         meta: Optional[MetaInfo] = getattr(self._original_model_type, "_meta", None)
 
         if meta is None:
             raise RuntimeError("Can't convert this model")
 
-        converted_attributes = self._get_converted_attributes(model_meta=meta)
-        converted_attributes.update(self._get_converted_fields(model_meta=meta))
+        return ConversionPlan(
+            model_name=self._original_model_type.__name__,
+            attributes=self._get_converted_attributes(),
+            fields=self._get_converted_fields(model_meta=meta),
+            meta_attributes=self._get_converted_meta_attributes(model_meta=meta),
+        )
 
-        return type(self._original_model_type.__name__, (DjangoModel,), converted_attributes)  # type: ignore
-
-    def _get_converted_fields(self, model_meta: MetaInfo) -> Dict[str, DjangoField]:
-        converted_fields: Dict[str, DjangoField] = {}
+    def _get_converted_fields(self, model_meta: MetaInfo) -> Dict[str, "FieldPlan"]:
+        converted_fields: Dict[str, "FieldPlan"] = {}
 
         for field_name, field in model_meta.fields_map.items():
             if field_name in self._redefined_attributes:
-                converted_fields[field_name] = self._redefined_attributes.get(field_name)
+                # redefined fields are passed with the attributes
                 continue
 
             if field_name == "id" and field is model_meta.pk and isinstance(field, tortoise_fields.IntField):
                 # skip default tortoise id(pk) field
                 continue
 
-            converter = self._FIELDS_RATIO.get(type(field))
+            if self._is_generated_by_tortoise(field):
+                # skip fields added by `Tortoise.init` (possible with the lazy conversion)
+                continue
+
+            converter = self.get_field_converter(type(field))
 
             if converter is None:
                 raise FieldIsNotSupported(f"{type(field)} is not supported field.")
 
-            converted_fields[field_name] = converter(field).converted_field
+            if not is_profiling():
+                converted_fields[field_name] = converter(field).converted_field_plan  # type: ignore
+                continue
+
+            started_at = perf_counter()
+            converter_instance = converter(field)
+            converted_fields[field_name] = converter_instance.converted_field_plan  # type: ignore
+
+            record_field(
+                FieldConversionRecord(
+                    model_name=self._model_path,
+                    field_name=field_name,
+                    converter_name=converter.__name__,
+                    seconds=perf_counter() - started_at,
+                    dropped_kwargs=converter_instance.dropped_kwargs,
+                )
+            )
 
         return converted_fields
 
-    def _get_converted_attributes(self, model_meta: MetaInfo) -> dict:
+    @staticmethod
+    def _is_generated_by_tortoise(field: TortoiseField) -> bool:
+        return (
+            isinstance(field, tortoise_relational_fields.BackwardFKRelation)
+            or field.reference is not None
+            or getattr(field, "_generated", False) is True
+        )
+
+    def _get_converted_attributes(self) -> dict:
+        if self.lean:
+            original_attributes = vars(self._original_model_type)
+            attributes = {
+                name: original_attributes[name] for name in self._LEAN_ATTRIBUTES if name in original_attributes
+            }
+            attributes.update(self._redefined_attributes)
+            attributes.pop("Meta", None)
+
+            return attributes
+
         attributes = self._original_model_type_attributes
         attributes.update(self._redefined_attributes)
 
         attributes.pop("_meta", None)
-        attributes["Meta"] = self._get_converted_meta_class(model_meta=model_meta)
+        attributes.pop("Meta", None)
 
         return attributes
 
-    def _get_converted_meta_class(self, model_meta: MetaInfo) -> Type[object]:
-        if self._redefined_attributes.get("Meta", None):
-            return self._redefined_attributes.get("Meta")  # type: ignore
+    def _get_converted_meta_attributes(self, model_meta: MetaInfo) -> Dict[str, Any]:
+        redefined_meta_class = self._redefined_attributes.get("Meta", None)
 
-        model_meta_class: Type[object] = getattr(self._original_model_type, "Meta", type)
-        meta_attributes = dict(model_meta_class.__dict__)
+        if redefined_meta_class:
+            meta_attributes = dict(redefined_meta_class.__dict__)
+        else:
+            model_meta_class: Type[object] = getattr(self._original_model_type, "Meta", type)
+            meta_attributes = dict(model_meta_class.__dict__)
 
-        meta_attributes["db_table"] = meta_attributes.get("table", model_meta.db_table)
+            if "table" in meta_attributes:
+                # only the explicit table, the default one is set by `Tortoise.init`,
+                # so the lazy conversion would depend on whether it was called
+                meta_attributes["db_table"] = meta_attributes.pop("table")
 
         meta_attributes.pop("__dict__", None)
-        meta_attributes.pop("table", None)
+        meta_attributes.pop("__weakref__", None)
 
-        return type("Meta", (), meta_attributes)  # type: ignore
+        return meta_attributes
 
 
 class ConvertedModelMeta(BaseConvertedModelMeta, TortoiseModelMeta):
@@ -114,12 +272,27 @@ class ConvertedModelMeta(BaseConvertedModelMeta, TortoiseModelMeta):
     model_type_to_convert = TortoiseModel
 
     @property
-    def DjangoModel(cls) -> Optional[Type[DjangoModel]]:
-        return cls._converted_model  # type: ignore
+    def DjangoModel(cls) -> Optional[Type["DjangoModel"]]:
+        return cls.warm()  # type: ignore
+
+
+class LazyConvertedModelMeta(ConvertedModelMeta):
+    lazy_conversion = True
 
 
 class ConvertedModel(metaclass=ConvertedModelMeta):
-    DjangoModel: Optional[Type[DjangoModel]]
+    DjangoModel: Optional[Type["DjangoModel"]]
+
+    class Meta:
+        abstract = True
+
+
+class LazyConvertedModel(metaclass=LazyConvertedModelMeta):
+    """
+    The django model is built on first access to `DjangoModel` or on `warm()` call.
+    """
+
+    DjangoModel: Optional[Type["DjangoModel"]]
 
     class Meta:
         abstract = True
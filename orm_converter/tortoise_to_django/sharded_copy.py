@@ -0,0 +1,200 @@
+import asyncio
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.context import BaseContext
+from time import perf_counter
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple, Type
+
+import django
+from django.apps import apps
+from django.conf import settings
+from django.db import connections
+from django.db.models import Max, Min
+from django.db.models import Model as DjangoModel
+from tortoise import Tortoise
+from tortoise.models import Model as TortoiseModel
+
+from orm_converter.tortoise_to_django.copier import (TO_DJANGO, TO_TORTOISE,
+                                                     TableCopier)
+
+PkRange = Tuple[Any, Any]
+# (after_pk, until_pk), `None` means unbounded
+
+
+class ShardResult(NamedTuple):
+    number: int
+    after_pk: Any
+    until_pk: Any
+    rows: int
+    seconds: float
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.seconds if self.seconds else 0.0
+
+
+class _Shard(NamedTuple):
+    number: int
+    pk_range: PkRange
+    tortoise_model_type: Type[TortoiseModel]
+    django_model_label: Optional[str]
+    tortoise_config: Dict[str, Any]
+    direction: str
+    copier_kwargs: Dict[str, Any]
+
+
+def copy_sharded(
+    tortoise_model_type: Type[TortoiseModel],
+    tortoise_config: Dict[str, Any],
+    direction: str = TO_DJANGO,
+    shards: int = 4,
+    workers: Optional[int] = None,
+    django_model_type: Optional[Type[DjangoModel]] = None,
+    checkpoint: Optional[str] = None,
+    mp_context: Optional[BaseContext] = None,
+    **copier_kwargs: Any,
+) -> List[ShardResult]:
+    """
+    Splits the primary keys of the source table into `shards` ranges
+    and copies them with `TableCopier` in a process pool, each worker with its own connections.
+    Only integer primary keys can be split. Must be called outside of a running event loop.
+    The tortoise primary key bounds are queried in a worker too, so `Tortoise` of this process isn't initialized.
+    The workers set django up from `DJANGO_SETTINGS_MODULE`, or, if the settings were configured manually,
+    from the `INSTALLED_APPS` and the databases of this process. Other manually configured settings
+    aren't passed to the workers started with `spawn` (the default on macOS and Windows).
+    :param tortoise_config: config for `Tortoise.init` in the workers.
+    :param checkpoint: prefix of the shards checkpoint files.
+    :param mp_context: multiprocessing context of the workers.
+    :param copier_kwargs: other `TableCopier` arguments, except `after_pk` and `until_pk`.
+    """
+    if direction not in (TO_DJANGO, TO_TORTOISE):
+        raise ValueError(f"Unknown direction: {direction}.")
+
+    if "after_pk" in copier_kwargs or "until_pk" in copier_kwargs:
+        raise TypeError("The primary key ranges of the shards are planned by `copy_sharded`.")
+
+    copier = TableCopier(tortoise_model_type, django_model_type, **copier_kwargs)
+
+    pk_bounds = None if direction == TO_DJANGO else _get_django_pk_bounds(copier)
+
+    # connections must not be shared with the forked workers
+    connections.close_all()
+
+    with ProcessPoolExecutor(
+        max_workers=workers or shards,
+        mp_context=mp_context,
+        initializer=_setup_worker,
+        initargs=(list(settings.INSTALLED_APPS), dict(connections.databases)),
+    ) as executor:
+        if pk_bounds is None:
+            pk_bounds = executor.submit(_get_tortoise_pk_bounds, tortoise_model_type, tortoise_config).result()
+
+        django_model_label = None if django_model_type is None else django_model_type._meta.label
+        # the model classes built by the conversion can't be pickled, the workers find them in the apps registry
+
+        shards_specs = [
+            _Shard(
+                number=number,
+                pk_range=pk_range,
+                tortoise_model_type=tortoise_model_type,
+                django_model_label=django_model_label,
+                tortoise_config=tortoise_config,
+                direction=direction,
+                copier_kwargs={
+                    **copier_kwargs,
+                    "checkpoint": None if checkpoint is None else f"{checkpoint}.{number}",
+                },
+            )
+            for number, pk_range in enumerate(plan_pk_ranges(*pk_bounds, shards=shards))
+        ]
+
+        return list(executor.map(_copy_shard, shards_specs))
+
+
+def plan_pk_ranges(min_pk: Optional[int], max_pk: Optional[int], shards: int) -> List[PkRange]:
+    """
+    Splits the primary keys into `shards` ranges of equal size.
+    The first and the last ranges are unbounded, so the rows added during the copy aren't missed.
+    """
+    if min_pk is None or max_pk is None:
+        return [(None, None)]
+
+    if not isinstance(min_pk, int) or not isinstance(max_pk, int):
+        raise ValueError("Only integer primary keys can be split into ranges.")
+
+    shards = max(1, min(shards, max_pk - min_pk + 1))
+    step = -(-(max_pk - min_pk + 1) // shards)
+    bounds = [min_pk - 1 + step * index for index in range(1, shards)]
+
+    return list(zip([None, *bounds], [*bounds, None]))
+
+
+def _get_tortoise_pk_bounds(
+    tortoise_model_type: Type[TortoiseModel], tortoise_config: Dict[str, Any]
+) -> Tuple[Any, Any]:
+    return asyncio.run(_get_tortoise_pk_bounds_async(tortoise_model_type, tortoise_config))
+
+
+async def _get_tortoise_pk_bounds_async(
+    tortoise_model_type: Type[TortoiseModel], tortoise_config: Dict[str, Any]
+) -> Tuple[Any, Any]:
+    await Tortoise.init(config=tortoise_config)
+
+    try:
+        pk = tortoise_model_type._meta.pk_attr
+        queryset = tortoise_model_type.all().limit(1)
+
+        min_pks = await queryset.order_by(pk).values_list(pk, flat=True)
+        max_pks = await queryset.order_by(f"-{pk}").values_list(pk, flat=True)
+    finally:
+        await Tortoise.close_connections()
+
+    return (min_pks[0], max_pks[0]) if min_pks else (None, None)
+
+
+def _get_django_pk_bounds(copier: TableCopier) -> Tuple[Any, Any]:
+    manager = copier.django_model_type._default_manager.db_manager(copier.using)
+    bounds = manager.aggregate(min_pk=Min("pk"), max_pk=Max("pk"))
+
+    return bounds["min_pk"], bounds["max_pk"]
+
+
+def _setup_worker(installed_apps: List[str], databases: Dict[str, Dict[str, Any]]):
+    if not settings.configured and not os.environ.get("DJANGO_SETTINGS_MODULE"):
+        settings.configure(INSTALLED_APPS=installed_apps, DATABASES=databases)
+
+    django.setup()
+
+    for alias, database in databases.items():
+        # e.g. the databases added in runtime
+        connections.databases.setdefault(alias, database)
+
+
+def _copy_shard(shard: _Shard) -> ShardResult:
+    return asyncio.run(_copy_shard_async(shard))
+
+
+async def _copy_shard_async(shard: _Shard) -> ShardResult:
+    django_model_type = None
+
+    if shard.django_model_label is not None:
+        django_model_type = apps.get_model(shard.django_model_label)
+
+    after_pk, until_pk = shard.pk_range
+    copier = TableCopier(
+        shard.tortoise_model_type, django_model_type, after_pk=after_pk, until_pk=until_pk, **shard.copier_kwargs
+    )
+
+    await Tortoise.init(config=shard.tortoise_config)
+
+    try:
+        started = perf_counter()
+
+        if shard.direction == TO_DJANGO:
+            rows = await copier.copy_to_django()
+        else:
+            rows = await copier.copy_to_tortoise()
+
+        return ShardResult(shard.number, after_pk, until_pk, rows, perf_counter() - started)
+    finally:
+        await Tortoise.close_connections()
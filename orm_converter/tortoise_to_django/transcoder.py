@@ -0,0 +1,149 @@
+from operator import itemgetter
+from typing import (Any, Callable, Dict, Iterable, Iterator, List, Optional,
+                    Sequence, Tuple, Type)
+
+from django.db.models import Model as DjangoModel
+from django.db.models.base import ModelState
+from tortoise.models import Model as TortoiseModel
+
+
+class _BaseTranscoder:
+    def __init__(self, tortoise_model_type: Type[TortoiseModel], django_model_type: Optional[Type[DjangoModel]] = None):
+        if django_model_type is None:
+            django_model_type = getattr(tortoise_model_type, "DjangoModel", None)
+
+        if django_model_type is None:
+            raise RuntimeError(f"{tortoise_model_type} has no converted django model, pass it explicitly.")
+
+        self.tortoise_model_type = tortoise_model_type
+        self.django_model_type = django_model_type
+        self.attributes = _get_attributes(tortoise_model_type, django_model_type)
+        # (tortoise attribute, django attname) pairs
+
+        self._tortoise_attributes = tuple(attribute for attribute, _ in self.attributes)
+        self._attnames = tuple(attname for _, attname in self.attributes)
+
+
+class Transcoder(_BaseTranscoder):
+    """
+    Converts tortoise model instances to instances of the converted django model.
+    The attributes to copy are found once, so the instances are converted without per-row introspection.
+    Related objects are not fetched, only their primary keys (`*_id` attributes) are copied.
+    """
+
+    def __init__(self, tortoise_model_type: Type[TortoiseModel], django_model_type: Optional[Type[DjangoModel]] = None):
+        super().__init__(tortoise_model_type, django_model_type)
+
+        self._get_values = _get_items_getter(self._tortoise_attributes)
+
+    def transcode(self, instance: TortoiseModel) -> DjangoModel:
+        """
+        Returns an unsaved django instance, it can be saved or passed to `bulk_create`.
+        `__init__` of the django model isn't called, so `pre_init`/`post_init` signals aren't sent.
+        """
+        values = instance.__dict__
+        django_instance = object.__new__(self.django_model_type)
+        django_instance._state = ModelState()
+
+        try:
+            django_instance.__dict__.update(zip(self._attnames, self._get_values(values)))
+        except KeyError:
+            # not fetched attributes are deferred in the django instance
+            django_instance.__dict__.update(
+                (attname, values[attribute]) for attribute, attname in self.attributes if attribute in values
+            )
+
+        return django_instance
+
+    def transcode_many(self, instances: Iterable[TortoiseModel]) -> Iterator[DjangoModel]:
+        transcode = self.transcode
+
+        for instance in instances:
+            yield transcode(instance)
+
+    def transcode_batch(self, instances: Iterable[TortoiseModel]) -> List[DjangoModel]:
+        return list(self.transcode_many(instances))
+
+
+class ReverseTranscoder(_BaseTranscoder):
+    """
+    Converts instances of the converted django model, or `values_list(*transcoder.fields)` rows,
+    to tortoise model instances. The instances are built like `Model._init_from_db` builds them,
+    `__init__` isn't called and the values aren't converted again.
+    """
+
+    def __init__(self, tortoise_model_type: Type[TortoiseModel], django_model_type: Optional[Type[DjangoModel]] = None):
+        super().__init__(tortoise_model_type, django_model_type)
+
+        self.fields = self._attnames
+        # the order of `values_list` fields expected by `transcode_row`
+
+        self._get_values = _get_items_getter(self._attnames)
+
+    def transcode(self, instance: DjangoModel) -> TortoiseModel:
+        values = instance.__dict__
+
+        try:
+            return self.transcode_row(self._get_values(values))
+        except KeyError:
+            # deferred fields
+            tortoise_instance = self._create_instance(partial=True)
+            tortoise_instance.__dict__.update(
+                (attribute, values[attname]) for attribute, attname in self.attributes if attname in values
+            )
+
+            return tortoise_instance
+
+    def transcode_row(self, row: Sequence) -> TortoiseModel:
+        tortoise_instance = self._create_instance(partial=False)
+        tortoise_instance.__dict__.update(zip(self._tortoise_attributes, row))
+
+        return tortoise_instance
+
+    def transcode_many(self, instances: Iterable[DjangoModel]) -> Iterator[TortoiseModel]:
+        transcode = self.transcode
+
+        for instance in instances:
+            yield transcode(instance)
+
+    def transcode_rows(self, rows: Iterable[Sequence]) -> Iterator[TortoiseModel]:
+        transcode_row = self.transcode_row
+
+        for row in rows:
+            yield transcode_row(row)
+
+    def transcode_batch(self, instances: Iterable[DjangoModel]) -> List[TortoiseModel]:
+        return list(self.transcode_many(instances))
+
+    def _create_instance(self, partial: bool) -> TortoiseModel:
+        tortoise_instance = object.__new__(self.tortoise_model_type)
+        tortoise_instance._partial = partial
+        tortoise_instance._saved_in_db = True
+
+        return tortoise_instance
+
+
+def _get_items_getter(keys: Tuple[str, ...]) -> Callable[[Dict[str, Any]], Tuple]:
+    if len(keys) == 1:
+        key = keys[0]
+        return lambda values: (values[key],)
+
+    return itemgetter(*keys)
+
+
+def _get_attributes(
+    tortoise_model_type: Type[TortoiseModel], django_model_type: Type[DjangoModel]
+) -> Tuple[Tuple[str, str], ...]:
+    fields_map = tortoise_model_type._meta.fields_map
+    attributes = []
+
+    for field in django_model_type._meta.concrete_fields:
+        if field.name not in fields_map and not field.primary_key:
+            # e.g. django fields added with `RedefinedAttributes`
+            continue
+
+        # tortoise keeps the related object primary key in `<field>_id` attribute, like django
+        attribute = f"{field.name}_id" if field.is_relation else field.name
+        attributes.append((attribute, field.attname))
+
+    return tuple(attributes)
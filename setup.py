@@ -23,6 +23,7 @@ setup(
     license="MIT",
     author="Maxim",
     install_requires=["tortoise-orm~=0.17.6", "Django~=3.2.6"],
+    entry_points={"console_scripts": ["orm-converter=orm_converter.cli:main"]},
     author_email="maximzayats1@gmail.com",
     keywords=[
         "python",
@@ -0,0 +1,7 @@
+from orm_converter.tortoise_to_django.apps import TortoiseModelsConfig
+
+
+class AppsTestConfig(TortoiseModelsConfig):
+    name = 'tests'
+    label = 'tortoise_models_config_test'
+    tortoise_modules = ['tests.apps_models']
@@ -0,0 +1,10 @@
+from tortoise import Model as TortoiseModel
+from tortoise import fields as tortoise_fields
+
+
+class AppConfigAuthor(TortoiseModel):
+    name = tortoise_fields.CharField(max_length=255)
+
+
+class AppConfigBook(TortoiseModel):
+    author = tortoise_fields.ForeignKeyField('models.AppConfigAuthor', related_name='books')
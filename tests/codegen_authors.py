@@ -0,0 +1,9 @@
+from tortoise import Model as TortoiseModel
+from tortoise import fields as tortoise_fields
+
+
+class CodegenAuthor(TortoiseModel):
+    name = tortoise_fields.CharField(max_length=255)
+
+    class Meta:
+        app_label = 'test'
@@ -0,0 +1,12 @@
+from tortoise import Model as TortoiseModel
+from tortoise import fields as tortoise_fields
+
+from .codegen_authors import CodegenAuthor  # NOQA  # shared model
+
+
+class CodegenBook(TortoiseModel):
+    title = tortoise_fields.CharField(max_length=255)
+    author = tortoise_fields.ForeignKeyField('test.CodegenAuthor', related_name='books')
+
+    class Meta:
+        app_label = 'test'
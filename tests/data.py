@@ -10,7 +10,10 @@ from tortoise.fields import relational as tortoise_relational_fields
 
 from orm_converter.tortoise_to_django import ConvertedModel
 
-settings.configure()
+if not settings.configured:
+    # already configured in the workers of the multi-process tests
+    settings.configure()
+
 django.setup()
 
 
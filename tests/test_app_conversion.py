@@ -0,0 +1,72 @@
+from tortoise import Model as TortoiseModel
+from tortoise import fields as tortoise_fields
+
+from orm_converter.tortoise_to_django import Converter, convert_app
+from orm_converter.tortoise_to_django.app_converter import sort_models
+
+from . import data  # NOQA  # configures django
+
+
+class AppConversionAuthor(TortoiseModel):
+    name = tortoise_fields.CharField(max_length=255)
+    best_book = tortoise_fields.ForeignKeyField('test.AppConversionBook', null=True, related_name=False)
+
+    class Meta:
+        app_label = 'test'
+
+
+class AppConversionBook(TortoiseModel):
+    author = tortoise_fields.ForeignKeyField('test.AppConversionAuthor', related_name='books')
+
+    class Meta:
+        app_label = 'test'
+
+
+class AppConversionReview(TortoiseModel):
+    book = tortoise_fields.ForeignKeyField('test.AppConversionBook', related_name='reviews')
+
+    class Meta:
+        app_label = 'test'
+
+
+def test_sort_models():
+    assert sort_models([AppConversionReview, AppConversionBook]) == [AppConversionBook, AppConversionReview]
+    assert sort_models([AppConversionReview, AppConversionBook, AppConversionAuthor]) == [
+        AppConversionBook,
+        AppConversionAuthor,
+        AppConversionReview,
+    ]
+
+
+def test_convert_app():
+    converted_models = convert_app([AppConversionReview, AppConversionBook, AppConversionAuthor])
+
+    order = list(converted_models)
+
+    assert len(order) == 3
+    assert order.index(AppConversionBook) < order.index(AppConversionReview)
+
+    review_model = converted_models[AppConversionReview]
+    book_model = converted_models[AppConversionBook]
+
+    assert review_model._meta.get_field('book').related_model is book_model  # type: ignore
+
+
+class _CustomTableConverter(Converter):
+    def _get_converted_meta_attributes(self, model_meta):
+        return {**super()._get_converted_meta_attributes(model_meta), 'db_table': 'custom_table'}
+
+
+class AppConversionTable(TortoiseModel):
+    name = tortoise_fields.CharField(max_length=255)
+
+    class Meta:
+        app_label = 'test'
+
+
+def test_convert_app_with_converter_type():
+    assert Converter(AppConversionTable).plan.meta_attributes.get('db_table') != 'custom_table'
+
+    converted_models = convert_app([AppConversionTable], converter_type=_CustomTableConverter, app_label='custom')
+
+    assert converted_models[AppConversionTable]._meta.db_table == 'custom_table'  # type: ignore
@@ -0,0 +1,22 @@
+import subprocess
+import sys
+
+CODE = """
+import sys
+import tests.apps_models
+assert 'django' not in sys.modules
+
+import django
+from django.conf import settings
+settings.configure(INSTALLED_APPS=['tests.apps_config.AppsTestConfig'])
+django.setup()
+
+from django.apps import apps
+models = apps.get_app_config('tortoise_models_config_test').models
+assert set(models) == {'appconfigauthor', 'appconfigbook'}
+assert models['appconfigbook']._meta.get_field('author').related_model is models['appconfigauthor']
+"""
+
+
+def test_tortoise_models_config():
+    subprocess.run([sys.executable, '-c', CODE], check=True)
@@ -0,0 +1,127 @@
+import asyncio
+import time
+
+from django.db import connections
+from tortoise import Model as TortoiseModel
+from tortoise import fields as tortoise_fields
+
+from orm_converter.tortoise_to_django import ConvertedModel
+from orm_converter.tortoise_to_django.async_bridge import (AsyncModel,
+                                                           DjangoExecutor,
+                                                           aiterate)
+
+from . import data  # NOQA  # configures django
+
+
+class AsyncBridgeItem(TortoiseModel, ConvertedModel):
+    name = tortoise_fields.CharField(max_length=255)
+
+    class Meta:
+        app_label = 'test'
+
+
+async def _query(executor):
+    items = AsyncModel(AsyncBridgeItem, executor, using='async_bridge')
+    django_model_type = items.model_type
+
+    await items.abulk_create([django_model_type(id=pk, name=f'item {pk}') for pk in range(1, 6)])
+
+    assert await items.acount() == 5
+    assert (await items.aget(pk=3)).name == 'item 3'
+    assert [item.pk for item in await items.afilter(pk__gt=3)] == [4, 5]
+    assert await items.aupdate({'pk': 1}, name='changed') == 1
+    assert await items.adelete(pk__gt=3) == 2
+    assert not await items.aexists(name='item 1')
+
+    await items.abulk_create([django_model_type(id=pk, name=f'item {pk}') for pk in range(10, 30)])
+
+    assert [item.pk async for item in items.aiterate(pk__gte=10, chunk_size=3, max_chunks=1)] == list(range(10, 30))
+
+    names = []
+
+    rows = aiterate(items.objects.order_by('pk').values_list('name', flat=True), 4, 1)
+
+    try:
+        async for name in rows:
+            names.append(name)
+
+            if len(names) == 6:
+                break
+    finally:
+        await rows.aclose()  # type: ignore
+
+    assert names == ['changed', 'item 2', 'item 3', 'item 10', 'item 11', 'item 12']
+    assert executor.metrics.running == 0
+
+    # the iteration doesn't hold the only executor thread
+    names = []
+
+    async for item in items.aiterate(pk__gte=10, chunk_size=2, max_chunks=1):
+        names.append((await items.aget(pk=item.pk)).name)
+
+    assert names == [f'item {pk}' for pk in range(10, 30)]
+
+
+def test_async_model(tmp_path):
+    connections.databases['async_bridge'] = {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'NAME': str(tmp_path / 'db.sqlite3'),
+    }
+    executor = DjangoExecutor(max_workers=1)
+
+    try:
+        with connections['async_bridge'].schema_editor() as editor:
+            editor.create_model(AsyncBridgeItem.DjangoModel)  # type: ignore
+
+        asyncio.run(asyncio.wait_for(_query(executor), timeout=10))
+
+        assert executor.metrics.completed == 28
+    finally:
+        executor.shutdown()
+        connections['async_bridge'].close()
+        del connections.databases['async_bridge']
+
+
+def test_executor_is_bounded():
+    executor = DjangoExecutor(max_workers=2)
+
+    async def run():
+        return await asyncio.gather(*(executor.run(time.sleep, 0.01) for _ in range(6)))
+
+    try:
+        asyncio.run(run())
+
+        metrics = executor.metrics
+
+        assert (metrics.queued, metrics.running, metrics.completed) == (0, 0, 6)
+        assert metrics.max_queued >= 4
+    finally:
+        executor.shutdown()
+
+
+def test_cancelled_iteration_closes_cursor():
+    closed = []
+
+    class QuerySet:
+        def iterator(self, chunk_size):
+            try:
+                yield from range(1000)
+            finally:
+                closed.append(True)
+
+    async def consume(rows, started):
+        async for _ in rows:
+            started.set()
+            await asyncio.sleep(1)
+
+    async def run():
+        started = asyncio.Event()
+        task = asyncio.ensure_future(consume(aiterate(QuerySet(), 10, 1), started))
+
+        await started.wait()
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+
+    asyncio.run(run())
+
+    assert closed == [True]
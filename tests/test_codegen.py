@@ -0,0 +1,47 @@
+from django.db import models as django_models
+from tortoise import Model as TortoiseModel
+from tortoise import fields as tortoise_fields
+
+from orm_converter.tortoise_to_django import (ConvertedModel,
+                                              RedefinedAttributes)
+from orm_converter.tortoise_to_django.codegen import (generate_models_source,
+                                                      generate_modules_source)
+
+from .data import TEST_DATA
+
+
+class CodegenArticle(TortoiseModel, ConvertedModel):
+    title = tortoise_fields.CharField(max_length=255)
+    slug = tortoise_fields.CharField(max_length=50)
+
+    class Meta:
+        app_label = 'test'
+
+    class RedefinedAttributes(RedefinedAttributes):  # type: ignore
+        slug = django_models.SlugField(unique=True)
+
+
+def test_codegen():
+    source = generate_models_source(tortoise_model_type for _, tortoise_model_type in TEST_DATA)
+
+    compile(source, 'models.py', 'exec')
+
+    assert 'class DjangoModelCase2(models.Model):' in source
+    assert "field_0 = models.BigIntegerField(db_index=True, primary_key=True, " \
+           "unique=True, verbose_name='Test description')" in source
+
+
+def test_codegen_redefined_fields():
+    source = generate_models_source([CodegenArticle])
+
+    assert 'slug = models.SlugField(unique=True)' in source
+    assert 'title = models.CharField(max_length=255)' in source
+
+
+def test_codegen_workers():
+    modules = ['tests.codegen_authors', 'tests.codegen_books']
+    source = generate_modules_source(modules, workers=1)
+
+    assert generate_modules_source(modules, workers=2) == source
+    assert source.count('class CodegenAuthor(models.Model):') == 1
+    assert 'class CodegenBook(models.Model):' in source
@@ -0,0 +1,22 @@
+from orm_converter.tortoise_to_django import Converter
+
+from .data import TEST_DATA
+
+
+def test_conversion_plan_is_reused():
+    _, tortoise_model_type = TEST_DATA[1]
+
+    plan = Converter(tortoise_model_type).plan
+
+    assert Converter(tortoise_model_type).plan is plan
+    assert plan.build_fields()['field_0'] is not plan.build_fields()['field_0']
+
+
+class _SubclassConverter(Converter):
+    pass
+
+
+def test_conversion_plan_is_kept_per_converter_type():
+    _, tortoise_model_type = TEST_DATA[1]
+
+    assert _SubclassConverter(tortoise_model_type).plan is not Converter(tortoise_model_type).plan
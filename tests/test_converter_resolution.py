@@ -0,0 +1,13 @@
+from tortoise import fields as tortoise_fields
+
+from orm_converter.tortoise_to_django import Converter, field_converter
+
+
+class _CustomCharField(tortoise_fields.CharField):
+    pass
+
+
+def test_converter_resolution_by_mro():
+    assert Converter.get_field_converter(_CustomCharField) is field_converter.CharFieldConverter
+    assert Converter.get_field_converter(tortoise_fields.CharField) is field_converter.CharFieldConverter
+    assert Converter.get_field_converter(object) is None
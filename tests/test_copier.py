@@ -0,0 +1,93 @@
+import asyncio
+import json
+from enum import Enum
+from uuid import UUID
+
+from django.db import connections
+from tortoise import Model as TortoiseModel
+from tortoise import Tortoise
+from tortoise import fields as tortoise_fields
+
+from orm_converter.tortoise_to_django import ConvertedModel
+from orm_converter.tortoise_to_django.copier import TO_DJANGO, TableCopier
+
+from . import data  # NOQA  # configures django
+
+
+class Color(str, Enum):
+    RED = 'red'
+    BLUE = 'blue'
+
+
+class CopierItem(TortoiseModel, ConvertedModel):
+    name = tortoise_fields.CharField(max_length=255)
+    value = tortoise_fields.IntField(null=True)
+    payload = tortoise_fields.JSONField(null=True)
+    token = tortoise_fields.UUIDField(null=True)
+    color = tortoise_fields.CharEnumField(Color, default=Color.RED)
+
+    class Meta:
+        app_label = 'test'
+
+
+__models__ = [CopierItem]
+
+
+async def _copy(tmp_path):
+    django_model_type = CopierItem.DjangoModel  # type: ignore
+    django_items = django_model_type.objects.using('copier')
+    checkpoint = str(tmp_path / 'checkpoint.json')
+
+    await Tortoise.init(db_url='sqlite://:memory:', modules={'models': [__name__]})
+    await Tortoise.generate_schemas()
+
+    try:
+        await CopierItem.bulk_create(
+            [
+                CopierItem(id=pk, name=f'item {pk}', value=pk, payload={'pk': pk}, token=UUID(int=pk), color=Color.BLUE)
+                for pk in range(1, 8)
+            ]
+        )
+
+        with open(checkpoint, 'w') as f:
+            json.dump({'model': f'{__name__}.CopierItem', 'direction': TO_DJANGO, 'last_pk': 2}, f)
+
+        copier = TableCopier(CopierItem, chunk_size=2, checkpoint=checkpoint, using='copier')
+
+        assert await copier.copy_to_django() == 5
+        pks = await asyncio.get_running_loop().run_in_executor(
+            None, lambda: list(django_items.order_by('pk').values_list('pk', flat=True))
+        )
+        assert pks == [3, 4, 5, 6, 7]
+
+        await CopierItem.filter(id__gt=4).delete()
+        await CopierItem.filter(id=3).update(name='stale', payload={}, token=UUID(int=0), color=Color.RED)
+
+        copier = TableCopier(CopierItem, chunk_size=2, checkpoint=checkpoint, update_existing=True, using='copier')
+
+        assert await copier.copy_to_tortoise() == 5
+        assert await CopierItem.all().order_by('id').values_list('id', flat=True) == [1, 2, 3, 4, 5, 6, 7]
+        assert await CopierItem.filter(id__in=[3, 7]).order_by('id').values_list('name', flat=True) == [
+            'item 3',
+            'item 7',
+        ]
+
+        item = await CopierItem.get(id=3)
+        assert (item.payload, item.token, item.color) == ({'pk': 3}, UUID(int=3), Color.BLUE)
+    finally:
+        await Tortoise.close_connections()
+
+
+def test_copy(tmp_path):
+    connections.databases['copier'] = {'ENGINE': 'django.db.backends.sqlite3', 'NAME': str(tmp_path / 'db.sqlite3')}
+
+    try:
+        with connections['copier'].schema_editor() as editor:
+            editor.create_model(CopierItem.DjangoModel)  # type: ignore
+
+        asyncio.run(_copy(tmp_path))
+
+        assert not (tmp_path / 'checkpoint.json').exists()
+    finally:
+        connections['copier'].close()
+        del connections.databases['copier']
@@ -0,0 +1,19 @@
+import pytest
+
+from orm_converter.tortoise_to_django import Converter
+
+from .data import TEST_DATA
+
+
+@pytest.mark.parametrize(
+    'tortoise_model_type',
+    [tortoise_model_type for _, tortoise_model_type in TEST_DATA],
+)
+def test_extracted_kwargs_match_reformatted_kwargs(tortoise_model_type):
+    for field in tortoise_model_type._meta.fields_map.values():
+        converter = Converter.get_field_converter(type(field))
+
+        if converter is None:
+            continue
+
+        assert converter(field)._converted_field_kwargs == converter(field)._get_reformatted_kwargs()
@@ -0,0 +1,45 @@
+from tortoise import Model as TortoiseModel
+from tortoise import fields as tortoise_fields
+
+from orm_converter.tortoise_to_django import (convert_app,
+                                              get_django_model_fingerprint,
+                                              get_model_fingerprint)
+
+from . import data  # NOQA  # configures django
+from .data import TEST_DATA
+
+
+class FingerprintAuthor(TortoiseModel):
+    name = tortoise_fields.CharField(max_length=255, index=True)
+
+    class Meta:
+        app_label = 'test'
+        table = 'fingerprint_author'
+
+
+class FingerprintBook(TortoiseModel):
+    title = tortoise_fields.CharField(max_length=255)
+    author = tortoise_fields.ForeignKeyField('test.FingerprintAuthor', related_name='books')
+
+    class Meta:
+        app_label = 'test'
+        unique_together = (('title', 'author'),)
+
+
+def test_fingerprint_of_converted_model():
+    for _, tortoise_model_type in TEST_DATA:
+        fingerprint = get_model_fingerprint(tortoise_model_type)
+
+        assert fingerprint == get_django_model_fingerprint(tortoise_model_type.DjangoModel)  # type: ignore
+
+    converted_models = convert_app([FingerprintAuthor, FingerprintBook], app_label='fingerprint')
+
+    for tortoise_model_type, django_model_type in converted_models.items():
+        assert get_model_fingerprint(tortoise_model_type) == get_django_model_fingerprint(django_model_type)
+
+
+def test_fingerprint_changes_with_schema():
+    fingerprints = {get_model_fingerprint(tortoise_model_type) for _, tortoise_model_type in TEST_DATA}
+
+    assert len(fingerprints) == len(TEST_DATA)
+    assert get_model_fingerprint(FingerprintAuthor) != get_model_fingerprint(FingerprintBook)
@@ -0,0 +1,14 @@
+import subprocess
+import sys
+
+CODE = """
+import sys
+import orm_converter.tortoise_to_django
+assert 'tortoise' not in sys.modules and 'django' not in sys.modules
+from orm_converter.tortoise_to_django import ConvertedModel, LazyConvertedModel
+assert 'django.db.models' not in sys.modules
+"""
+
+
+def test_lazy_imports():
+    subprocess.run([sys.executable, '-c', CODE], check=True)
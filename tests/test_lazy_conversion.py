@@ -0,0 +1,42 @@
+from tortoise import Model as TortoiseModel
+from tortoise import fields as tortoise_fields
+
+from orm_converter.tortoise_to_django import LazyConvertedModel
+
+from . import data  # NOQA  # configures django
+
+
+def test_lazy_conversion():
+    class Meta:
+        app_label = 'test'
+
+    tortoise_model_type = type(
+        'TortoiseModelLazyCase',
+        (TortoiseModel, LazyConvertedModel),
+        {'Meta': Meta, 'field_0': tortoise_fields.IntField()}
+    )
+
+    assert tortoise_model_type._converted_model is None  # type: ignore
+
+    django_model_type = tortoise_model_type.warm()  # type: ignore
+
+    assert django_model_type is not None
+    assert tortoise_model_type.DjangoModel is django_model_type  # type: ignore
+    assert django_model_type._meta.get_field('field_0').get_internal_type() == 'IntegerField'
+
+
+def test_lazy_conversion_table_doesnt_depend_on_tortoise_init():
+    class Meta:
+        app_label = 'test'
+
+    tortoise_model_type = type(
+        'TortoiseModelLazyTableCase',
+        (TortoiseModel, LazyConvertedModel),
+        {'Meta': Meta, 'field_0': tortoise_fields.IntField()}
+    )
+    # the default table name set by `Tortoise.init`
+    tortoise_model_type._meta.db_table = 'tortoisemodellazytablecase'  # type: ignore
+
+    django_model_type = tortoise_model_type.warm()  # type: ignore
+
+    assert django_model_type._meta.db_table == 'test_tortoisemodellazytablecase'
@@ -0,0 +1,89 @@
+import gc
+import tracemalloc
+
+from tortoise import Model as TortoiseModel
+from tortoise import fields as tortoise_fields
+
+from orm_converter.tortoise_to_django import Converter, convert_app
+
+from . import data  # NOQA  # configures django
+
+MODELS_COUNT = 50
+MAX_RETAINED_BYTES_PER_MODEL = 48 * 1024
+
+
+def _generate_models(prefix: str, count: int = MODELS_COUNT):
+    class Meta:
+        app_label = 'test'
+
+    def get_name(self) -> str:
+        return self.name
+
+    return [
+        type(
+            f'{prefix}{index}',
+            (TortoiseModel,),
+            {
+                'Meta': Meta,
+                'name': tortoise_fields.CharField(max_length=255, null=True),
+                'value': tortoise_fields.IntField(default=0),
+                'created_at': tortoise_fields.DatetimeField(auto_now_add=True),
+                'get_name': get_name,
+            },
+        )
+        for index in range(count)
+    ]
+
+
+def _get_retained_bytes_per_model(models, lean: bool) -> float:
+    Converter.lean = lean
+    gc.collect()
+    tracemalloc.start()
+
+    try:
+        before, _ = tracemalloc.get_traced_memory()
+        converted_models = convert_app(models)
+        gc.collect()
+        after, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+        Converter.lean = False
+
+    assert all(converted_models.values())
+
+    return (after - before) / MODELS_COUNT
+
+
+def test_lean_conversion_memory():
+    default_bytes = _get_retained_bytes_per_model(_generate_models('TortoiseModelDefaultMemory'), lean=False)
+    lean_bytes = _get_retained_bytes_per_model(_generate_models('TortoiseModelLeanMemory'), lean=True)
+
+    assert lean_bytes < default_bytes
+    assert lean_bytes < MAX_RETAINED_BYTES_PER_MODEL
+
+
+def test_lean_conversion_namespace():
+    Converter.lean = True
+
+    try:
+        tortoise_model_type, = _generate_models('TortoiseModelLeanNamespace', count=1)
+        django_model_type = Converter(tortoise_model_type).converted_model
+    finally:
+        Converter.lean = False
+
+    assert not hasattr(django_model_type, 'get_name')
+    assert (Converter, tortoise_model_type) not in Converter._plans_cache
+
+
+def test_lean_conversion_ignores_cached_full_plan():
+    tortoise_model_type, = _generate_models('TortoiseModelLeanCached', count=1)
+    assert Converter(tortoise_model_type).plan is not None
+
+    Converter.lean = True
+
+    try:
+        django_model_type = Converter(tortoise_model_type).converted_model
+    finally:
+        Converter.lean = False
+
+    assert not hasattr(django_model_type, 'get_name')
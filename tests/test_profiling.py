@@ -0,0 +1,54 @@
+from threading import Thread
+
+from tortoise import Model as TortoiseModel
+from tortoise import fields as tortoise_fields
+
+from orm_converter.shared.profiling import ConversionProfiler
+from orm_converter.tortoise_to_django import ConvertedModel
+
+from . import data  # NOQA  # configures django
+
+
+def test_profiling():
+    class Meta:
+        app_label = 'test'
+
+    with ConversionProfiler() as profiler:
+        type(
+            'TortoiseModelProfilingCase',
+            (TortoiseModel, ConvertedModel),
+            {
+                'Meta': Meta,
+                'field_0': tortoise_fields.CharField(max_length=255),
+                'field_1': tortoise_fields.IntField(null=True, source_field='column_1'),
+            }
+        )
+
+    report = profiler.report()
+    model_report = report['models'][0]
+    field_report = model_report['fields'][0]
+
+    assert model_report['model_name'].endswith('TortoiseModelProfilingCase')
+    assert model_report['plan_source'] == 'built'
+    assert field_report['converter_name'] == 'CharFieldConverter'
+    assert field_report['dropped_kwargs'] == ()
+    assert model_report['fields'][1]['dropped_kwargs'] == ('source_field',)
+
+
+def test_profiling_is_per_context():
+    class Meta:
+        app_label = 'test'
+
+    def convert():
+        type(
+            'TortoiseModelProfilingThreadCase',
+            (TortoiseModel, ConvertedModel),
+            {'Meta': Meta, 'field_0': tortoise_fields.CharField(max_length=255)}
+        )
+
+    with ConversionProfiler() as profiler:
+        thread = Thread(target=convert)
+        thread.start()
+        thread.join()
+
+    assert profiler.models == []
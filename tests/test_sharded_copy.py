@@ -0,0 +1,106 @@
+import asyncio
+import multiprocessing
+
+import pytest
+from django.db import connections
+from tortoise import Model as TortoiseModel
+from tortoise import Tortoise
+from tortoise import fields as tortoise_fields
+
+from orm_converter.tortoise_to_django import ConvertedModel
+from orm_converter.tortoise_to_django.copier import TO_TORTOISE
+from orm_converter.tortoise_to_django.sharded_copy import (copy_sharded,
+                                                           plan_pk_ranges)
+
+from . import data  # NOQA  # configures django
+
+
+class ShardedCopyItem(TortoiseModel, ConvertedModel):
+    name = tortoise_fields.CharField(max_length=255)
+    payload = tortoise_fields.JSONField(null=True)
+
+    class Meta:
+        app_label = 'test'
+
+
+__models__ = [ShardedCopyItem]
+
+
+def test_plan_pk_ranges():
+    assert plan_pk_ranges(None, None, shards=4) == [(None, None)]
+    assert plan_pk_ranges(1, 10, shards=3) == [(None, 4), (4, 8), (8, None)]
+    assert plan_pk_ranges(5, 6, shards=4) == [(None, 5), (5, None)]
+
+
+async def _create_items(tortoise_config, count):
+    await Tortoise.init(config=tortoise_config)
+    await Tortoise.generate_schemas()
+
+    try:
+        await ShardedCopyItem.bulk_create(
+            [ShardedCopyItem(id=pk, name=f'item {pk}', payload={'pk': pk}) for pk in range(1, count + 1)]
+        )
+    finally:
+        await Tortoise.close_connections()
+
+
+async def _get_rows(tortoise_config):
+    await Tortoise.init(config=tortoise_config)
+
+    try:
+        return await ShardedCopyItem.all().order_by('id').values_list('name', 'payload')
+    finally:
+        await Tortoise.close_connections()
+
+
+def test_copy_sharded(tmp_path):
+    django_model_type = ShardedCopyItem.DjangoModel  # type: ignore
+    tortoise_config = {
+        'connections': {'default': f'sqlite://{tmp_path / "tortoise.sqlite3"}'},
+        'apps': {'models': {'models': [__name__]}},
+    }
+    connections.databases['sharded'] = {'ENGINE': 'django.db.backends.sqlite3', 'NAME': str(tmp_path / 'db.sqlite3')}
+
+    try:
+        with connections['sharded'].schema_editor() as editor:
+            editor.create_model(django_model_type)
+
+        asyncio.run(_create_items(tortoise_config, count=25))
+
+        with pytest.MonkeyPatch.context() as monkeypatch:
+            # the primary key bounds are queried in a worker, `Tortoise` of this process isn't initialized
+            monkeypatch.setattr(Tortoise, 'init', None)
+
+            results = copy_sharded(
+                ShardedCopyItem,
+                tortoise_config,
+                shards=3,
+                chunk_size=4,
+                using='sharded',
+                mp_context=multiprocessing.get_context('spawn'),
+            )
+
+        assert [(result.after_pk, result.until_pk, result.rows) for result in results] == [
+            (None, 9, 9),
+            (9, 18, 9),
+            (18, None, 7),
+        ]
+        assert django_model_type.objects.using('sharded').count() == 25
+        assert django_model_type.objects.using('sharded').get(pk=10).payload == {'pk': 10}
+
+        django_model_type.objects.using('sharded').filter(pk=25).update(name='changed', payload={'changed': True})
+
+        results = copy_sharded(
+            ShardedCopyItem, tortoise_config, TO_TORTOISE, shards=2, using='sharded', update_existing=True
+        )
+
+        assert sum(result.rows for result in results) == 25
+        assert asyncio.run(_get_rows(tortoise_config))[-1] == ('changed', {'changed': True})
+    finally:
+        connections['sharded'].close()
+        del connections.databases['sharded']
+
+
+def test_copy_sharded_with_pk_range():
+    with pytest.raises(TypeError):
+        copy_sharded(ShardedCopyItem, {}, after_pk=10)
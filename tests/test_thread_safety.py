@@ -0,0 +1,64 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from tortoise import Model as TortoiseModel
+from tortoise import fields as tortoise_fields
+
+from orm_converter.tortoise_to_django import (BaseTortoiseFieldConverter,
+                                              Converter, LazyConvertedModel,
+                                              field_converter)
+
+from . import data  # NOQA  # configures django
+
+
+class _ThreadSafetyCharField(tortoise_fields.CharField):
+    pass
+
+
+class _ThreadSafetyCharFieldConverter(field_converter.CharFieldConverter):
+    ORIGINAL_FIELD_TYPE = _ThreadSafetyCharField
+
+
+def test_concurrent_registration():
+    def resolve(_):
+        return Converter.get_field_converter(_ThreadSafetyCharField)
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        resolutions = executor.map(resolve, range(1000))
+        Converter.add_converters(_ThreadSafetyCharFieldConverter)
+        resolved_converters = set(resolutions)
+
+    assert resolved_converters <= {field_converter.CharFieldConverter, _ThreadSafetyCharFieldConverter}
+    assert Converter.get_field_converter(_ThreadSafetyCharField) is _ThreadSafetyCharFieldConverter
+    assert issubclass(_ThreadSafetyCharFieldConverter, BaseTortoiseFieldConverter)
+
+
+def test_concurrent_lazy_conversion():
+    class Meta:
+        app_label = 'test'
+
+    tortoise_model_type = type(
+        'TortoiseModelThreadSafetyCase',
+        (TortoiseModel, LazyConvertedModel),
+        {'Meta': Meta, 'field_0': tortoise_fields.IntField()}
+    )
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        django_model_types = set(executor.map(lambda _: tortoise_model_type.warm(), range(100)))  # type: ignore
+
+    assert len(django_model_types) == 1
+
+
+def test_lazy_conversions_of_different_models_are_not_serialized():
+    class Meta:
+        app_label = 'test'
+
+    first_model_type, second_model_type = (
+        type(name, (TortoiseModel, LazyConvertedModel), {'Meta': Meta, 'field_0': tortoise_fields.IntField()})
+        for name in ('TortoiseModelLockFirstCase', 'TortoiseModelLockSecondCase')
+    )
+
+    with first_model_type._conversion_lock:  # type: ignore
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            django_model_type = executor.submit(second_model_type.warm).result(timeout=10)  # type: ignore
+
+    assert django_model_type is second_model_type.DjangoModel  # type: ignore
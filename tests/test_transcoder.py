@@ -0,0 +1,95 @@
+from decimal import Decimal
+
+from tortoise import Model as TortoiseModel
+from tortoise import fields as tortoise_fields
+
+from orm_converter.tortoise_to_django import ConvertedModel
+from orm_converter.tortoise_to_django.transcoder import (ReverseTranscoder,
+                                                         Transcoder)
+
+from . import data  # NOQA  # configures django
+
+
+class TranscoderAuthor(TortoiseModel, ConvertedModel):
+    name = tortoise_fields.CharField(max_length=255)
+    rating = tortoise_fields.DecimalField(max_digits=4, decimal_places=2, null=True)
+    links = tortoise_fields.JSONField(null=True)
+
+    class Meta:
+        app_label = 'test'
+
+
+class TranscoderBook(TortoiseModel, ConvertedModel):
+    title = tortoise_fields.CharField(max_length=255)
+    author = tortoise_fields.ForeignKeyField('test.TranscoderAuthor', related_name='books')
+
+    class Meta:
+        app_label = 'test'
+
+
+def test_transcode():
+    authors = [
+        TranscoderAuthor(id=index, name=f'author {index}', rating=Decimal('1.5'), links={'site': f'{index}.example'})
+        for index in range(3)
+    ]
+
+    django_authors = Transcoder(TranscoderAuthor).transcode_batch(authors)
+
+    assert [author.pk for author in django_authors] == [0, 1, 2]
+    assert django_authors[1].name == 'author 1'
+    assert django_authors[1].rating == Decimal('1.5')
+    assert django_authors[1].links == {'site': '1.example'}
+    assert django_authors[1]._state.adding
+    assert isinstance(django_authors[1], TranscoderAuthor.DjangoModel)  # type: ignore
+
+
+def test_transcode_json_field():
+    author = TranscoderAuthor(id=1, name='author', links={'site': 'example.com'})
+
+    django_author = Transcoder(TranscoderAuthor).transcode(author)
+    links_field = TranscoderAuthor.DjangoModel._meta.get_field('links')  # type: ignore
+
+    assert links_field.get_prep_value(django_author.links) == '{"site": "example.com"}'
+
+
+def test_transcode_relations_and_deferred_fields():
+    book = TranscoderBook(id=1, title='title')
+    book.author_id = 7  # type: ignore  # set by `Tortoise.init` for fetched models
+
+    django_book = Transcoder(TranscoderBook).transcode(book)
+
+    assert django_book.author_id == 7  # type: ignore
+    assert 'author' not in django_book._state.fields_cache
+
+    del book.__dict__['title']
+
+    assert Transcoder(TranscoderBook).transcode(book).get_deferred_fields() == {'title'}
+
+
+def test_reverse_transcode():
+    django_model_type = TranscoderBook.DjangoModel  # type: ignore
+    transcoder = ReverseTranscoder(TranscoderBook)
+
+    book = transcoder.transcode(django_model_type(id=2, title='title', author_id=5))
+
+    assert isinstance(book, TranscoderBook)
+    assert (book.pk, book.title, book.author_id) == (2, 'title', 5)  # type: ignore
+    assert book._saved_in_db and not book._partial
+
+    assert transcoder.fields == ('id', 'title', 'author_id')
+
+    books = list(transcoder.transcode_rows([(3, 'first', 5), (4, 'second', 6)]))
+
+    rows = [(book.pk, book.title, book.author_id) for book in books]  # type: ignore
+
+    assert rows == [(3, 'first', 5), (4, 'second', 6)]
+
+
+def test_reverse_transcode_deferred_fields():
+    django_book = TranscoderBook.DjangoModel(id=2, title='title', author_id=5)  # type: ignore
+    del django_book.__dict__['title']
+
+    book = ReverseTranscoder(TranscoderBook).transcode(django_book)
+
+    assert book._partial
+    assert 'title' not in book.__dict__